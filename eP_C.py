@@ -2,28 +2,39 @@
     constants
 """
 
+from types import MappingProxyType, SimpleNamespace
+
 VERSION = "1.3.0"
 APP_NAME = "ThreadEPy"
 DEFAULT_EPLUS_PATH = r"C:\EnergyPlusV23-2-0"
 
+# EnergyPlus executable inside the installation directory
+EPLUS_EXECUTABLE = "energyplus.exe"
+
+# Most recent EnergyPlus output lines kept and shown per simulation
+LOG_LINES = 10
+
+# Most simulations listed in the live status table; the rest are summarized in one row
+DEFAULT_MAX_DISPLAY_ROWS = 30
+
 # UI Colors for dark theme
-UI_COLORS = {
-    'bg': '#2b2b2b',           # Dark background
-    'fg': '#ffffff',           # White text
-    'select_bg': '#404040',    # Selection background
-    'select_fg': '#ffffff',    # Selection text
-    'entry_bg': '#f0f0f0',     # Entry background - LIGHTER GRAY
-    'entry_fg': '#000000',     # Entry text - BLACK
-    'button_bg': '#505050',    # Button background
-    'button_fg': '#ffffff',    # Button text
-    'button_active': '#606060', # Button active
-    'accent': '#0d7377',       # Accent color (teal)
-    'banner_bg': '#1a1a1a',    # Banner background
-    'banner_fg': '#00d4aa'     # Banner text (bright teal)
-}
+UI_COLORS = SimpleNamespace(
+    bg='#2b2b2b',           # Dark background
+    fg='#ffffff',           # White text
+    select_bg='#404040',    # Selection background
+    select_fg='#ffffff',    # Selection text
+    entry_bg='#f0f0f0',     # Entry background - LIGHTER GRAY
+    entry_fg='#000000',     # Entry text - BLACK
+    button_bg='#505050',    # Button background
+    button_fg='#ffffff',    # Button text
+    button_active='#606060', # Button active
+    accent='#0d7377',       # Accent color (teal)
+    banner_bg='#1a1a1a',    # Banner background
+    banner_fg='#00d4aa'      # Banner text (bright teal)
+)
 
 # Output file mapping for EnergyPlus
-OUTPUT_FILE_MAP = {
+_OUTPUT_FILE_MAP = {
     'Output CSV': '.csv',
     'Output MTR': '.mtr',
     'Output ESO': '.eso',
@@ -57,6 +68,13 @@ OUTPUT_FILE_MAP = {
     'Output Tarcog': '.tarcog'
 }
 
+# Read-only views: OutputControl:Files field -> file suffix, and the reverse lookup
+OUTPUT_FILE_MAP = MappingProxyType(_OUTPUT_FILE_MAP)
+SUFFIX_TO_OUTPUT = MappingProxyType({suffix: name for name, suffix in _OUTPUT_FILE_MAP.items()})
+
+# OutputControl:Files field names, in the order the fields appear in the IDF object
+OUTPUT_PARAM_NAMES = tuple(_OUTPUT_FILE_MAP)
+
 # CSV Headers for simulation results
 CSV_HEADERS = [
     "#", "Job_ID", "WeatherFile", "ModelFile", "Progress(1-Completed/0-Failed)",
@@ -5,44 +5,77 @@
 
 import os
 import sys
+import tempfile
+import importlib
+import compileall
 import subprocess
+from importlib.metadata import distribution, PackageNotFoundError
+
+from eP_C import VERSION
+
+DEPENDENCIES = ['rich', 'psutil']
+
+# Lazily imported names: name -> (module, attribute or None for the module itself)
+LAZY_IMPORTS = {
+    'Live': ('rich.live', 'Live'),
+    'Table': ('rich.table', 'Table'),
+    'Panel': ('rich.panel', 'Panel'),
+    'Layout': ('rich.layout', 'Layout'),
+    'box': ('rich.box', None),
+    'Columns': ('rich.columns', 'Columns'),
+    'Text': ('rich.text', 'Text'),
+    'psutil': ('psutil', None)
+}
+
+# Stamp file marking a verified dependency install for this Python/app version
+DEPS_STAMP = os.path.join(
+    tempfile.gettempdir(),
+    f"threadepy_deps_{sys.version_info.major}{sys.version_info.minor}_{VERSION}.ok"
+)
+
+
+def is_installed(dep):
+    """Check the package metadata without importing the package itself"""
+    try:
+        distribution(dep)
+        return True
+    except PackageNotFoundError:
+        return False
 
 
 def check_and_install_dependencies():
     """Check if dependencies are installed, if not, attempt to install them"""
-    try:
-        import rich
-        import psutil
-    except ImportError:
-        print("Installing required dependencies (rich, psutil)...")
-        subprocess.check_call([sys.executable, "-m", "pip", "install", "rich", "psutil"])
+    # Skip the metadata probe once dependencies have been verified
+    if os.path.exists(DEPS_STAMP):
+        return
+
+    missing = [dep for dep in DEPENDENCIES if not is_installed(dep)]
+    if missing:
+        print(f"Installing required dependencies ({', '.join(missing)})...")
+        subprocess.check_call([sys.executable, "-m", "pip", "install", *missing])
         print("Dependencies installed successfully.")
 
+    try:
+        open(DEPS_STAMP, 'w').close()
+    except OSError:
+        pass
 
-def import_dependencies():
-    """Import all required dependencies after ensuring they're installed"""
-    check_and_install_dependencies()
 
-    from rich.live import Live
-    from rich.table import Table
-    from rich.panel import Panel
-    from rich.layout import Layout
-    from rich import box
-    from rich.columns import Columns
-    from rich.text import Text
+def __getattr__(name):
+    """Import Rich components and psutil on first attribute access"""
+    try:
+        module_name, attr = LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
 
-    import psutil
-    
-    return {
-        'Live': Live,
-        'Table': Table,
-        'Panel': Panel,
-        'Layout': Layout,
-        'box': box,
-        'Columns': Columns,
-        'Text': Text,
-        'psutil': psutil
-    }
+    check_and_install_dependencies()
+    obj = importlib.import_module(module_name)
+    if attr:
+        obj = getattr(obj, attr)
+
+    # Cache on the module so later lookups bypass __getattr__
+    globals()[name] = obj
+    return obj
 
 
 def check_python_version():
@@ -54,14 +87,11 @@ def check_python_version():
 
 def install_dependencies():
     """Install required dependencies"""
-    dependencies = ['rich', 'psutil']
-    
     print("Installing dependencies...")
-    for dep in dependencies:
-        try:
-            __import__(dep)
+    for dep in DEPENDENCIES:
+        if is_installed(dep):
             print(f"✓ {dep} is already installed")
-        except ImportError:
+        else:
             print(f"Installing {dep}...")
             subprocess.check_call([sys.executable, "-m", "pip", "install", dep])
             print(f"✓ {dep} installed successfully")
@@ -74,6 +104,7 @@ def verify_files():
         'eP_U.py',
         'eP_T.py',
         'eP_S.py',
+        'eP_W.py',
         'eP_G.py'
     ]
     
@@ -92,6 +123,14 @@ def verify_files():
     print("\n✓ All required files are present")
     return True
 
+def precompile_modules():
+    """Byte-compile the application modules so the first run skips compilation"""
+    app_dir = os.path.dirname(os.path.abspath(__file__))
+    if compileall.compile_dir(app_dir, maxlevels=0, quiet=1):
+        print("✓ Modules precompiled")
+    else:
+        print("✗ Some modules failed to precompile")
+
 def main():
     print("ThreadEPy - Setup")
     print("=" * 40)
@@ -111,6 +150,9 @@ def main():
         print(f"Error installing dependencies: {e}")
         return False
     
+    # Precompile modules
+    precompile_modules()
+    
     print("\n" + "=" * 40)
     print("✓ Setup completed successfully!")
     print("\nYou can now run the application with:")
@@ -120,7 +162,7 @@ def main():
     
     return True
 
-if __name__ == "__eP_P__":
+if __name__ == "__main__":
     success = main()
     if not success:
         input("\nPress Enter to exit...")
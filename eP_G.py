@@ -4,20 +4,71 @@
 
 import os
 import sys
-import glob
 import subprocess
-import tkinter as tk
-from tkinter import filedialog, messagebox, ttk
-from multiprocessing import cpu_count
 
-from eP_C import APP_NAME, VERSION, DEFAULT_EPLUS_PATH, UI_COLORS
-from eP_U import save_config_to_temp
+from eP_C import APP_NAME, VERSION, DEFAULT_EPLUS_PATH, EPLUS_EXECUTABLE, UI_COLORS
+from eP_U import save_config_to_temp, scan_simulation_folder
+
+# Logical processor count, read once for the worker defaults and spinbox range
+CPU_COUNT = os.cpu_count() or 1
+
+# Entry script relaunched with --run-simulations after the GUI closes
+MAIN_SCRIPT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'eP_P.py')
+
+# Banner font scale used when the window is created
+DEFAULT_FONT_SCALE = 1.0
+
+# Dark theme ttk styles that do not depend on window size: (style, options)
+DARK_STYLES = (
+    ('Dark.TFrame', {'background': UI_COLORS.bg}),
+    ('Dark.TLabel', {'background': UI_COLORS.bg, 'foreground': UI_COLORS.fg}),
+    ('Dark.TButton', {'background': UI_COLORS.button_bg, 'foreground': UI_COLORS.button_fg}),
+    ('Dark.TEntry', {'background': UI_COLORS.entry_bg, 'foreground': UI_COLORS.entry_fg}),
+    ('Dark.Treeview', {'background': UI_COLORS.bg, 'foreground': UI_COLORS.fg,
+                       'fieldbackground': UI_COLORS.bg}),
+    ('Dark.Treeview.Heading', {'background': UI_COLORS.button_bg, 'foreground': UI_COLORS.button_fg}),
+    ('Dark.TSpinbox', {'background': UI_COLORS.entry_bg, 'foreground': UI_COLORS.entry_fg}),
+    ('Dark.TLabelframe', {'background': UI_COLORS.bg, 'foreground': UI_COLORS.fg}),
+    ('Dark.TLabelframe.Label', {'background': UI_COLORS.bg, 'foreground': UI_COLORS.fg}),
+    # Banner colors; fonts are set per window size in configure_font_styles
+    ('Banner.TFrame', {'background': UI_COLORS.banner_bg}),
+    ('Banner.TLabel', {'background': UI_COLORS.banner_bg, 'foreground': 'yellow'}),
+    ('Version.TLabel', {'background': UI_COLORS.banner_bg, 'foreground': UI_COLORS.fg}),
+    ('Subtitle.TLabel', {'background': UI_COLORS.banner_bg, 'foreground': UI_COLORS.fg}),
+)
+
+# Check-column markers for the IDF file list
+CHECKED = '☑'
+UNCHECKED = '☐'
+
+# Tk stack, imported on first GUI construction so command-line runs skip it
+tk = ttk = filedialog = messagebox = None
+
+
+def import_tkinter():
+    """Import tkinter and its submodules into the module namespace"""
+    global tk, ttk, filedialog, messagebox
+    import tkinter as tk
+    from tkinter import filedialog, messagebox, ttk
+
+
+def path_problem(path):
+    """Stat a path once; return None if it is accessible, otherwise the reason it is not"""
+    try:
+        os.stat(path)
+    except FileNotFoundError:
+        return "does not exist"
+    except OSError as e:
+        return f"cannot be accessed ({e.strerror})"
+    return None
 
 
 class EnergyPlusGUI:
     """GUI for selecting simulation parameters"""
     
     def __init__(self):
+        import_tkinter()
+
         self.root = tk.Tk()
         self.root.title(f"{APP_NAME} v{VERSION}")
         self.root.iconbitmap('eP_P.ico')
@@ -34,68 +85,51 @@ class EnergyPlusGUI:
         self.idf_folder = tk.StringVar()
         self.epw_file = tk.StringVar()
         self.eplus_folder = tk.StringVar()
-        self.max_workers = tk.IntVar(value=max(1, cpu_count() - 1))
+        self.max_workers = tk.IntVar(value=max(1, CPU_COUNT - 1))
         self.csv_output = tk.StringVar(value="simulation_results.csv")
         
-        # Variables for IDF file selection
+        # Variables for IDF file selection (parallel lists, indexed by file list row)
         self.idf_files = []
-        self.idf_checkboxes = {}
+        self.idf_selected = []
         self.selected_files = []
+        self.loaded_folder_key = None  # (folder, mtime) of the currently listed folder
         
         # Result variables
         self.result = None
         
         self.create_widgets()
 
-    def on_window_resize(self, event):
-        """Handle window resize events for responsive design"""
-        if event.widget == self.root:
-            # Update canvas scroll region when window is resized
-            self.root.after_idle(lambda: self.canvas.configure(scrollregion=self.canvas.bbox("all")))
-
     def setup_dark_theme(self):
         """Configure dark theme for the application"""
-        # Calculate responsive font sizes based on window size
-        base_width = 900
-        current_width = self.root.winfo_width() if self.root.winfo_width() > 1 else base_width
-        scale_factor = current_width / base_width
-        
-        banner_font_size = max(24, int(32 * scale_factor)) 
-        subtitle_font_size = max(10, int(12 * scale_factor))
-        version_font_size = max(8, int(10 * scale_factor))
-        
         # Configure root window
-        self.root.configure(bg=UI_COLORS['bg'])
+        self.root.configure(bg=UI_COLORS.bg)
         
         # Configure ttk style
         self.style = ttk.Style()
         self.style.theme_use('clam')
         
-        # Configure ttk styles for dark theme with responsive fonts
-        self.style.configure('Dark.TFrame', background=UI_COLORS['bg'])
-        self.style.configure('Dark.TLabel', background=UI_COLORS['bg'], foreground=UI_COLORS['fg'])
-        self.style.configure('Dark.TButton', background=UI_COLORS['button_bg'], foreground=UI_COLORS['button_fg'])
-        self.style.configure('Dark.TEntry', background=UI_COLORS['entry_bg'], foreground=UI_COLORS['entry_fg'])
-        self.style.configure('Dark.TCheckbutton', background=UI_COLORS['bg'], foreground=UI_COLORS['fg'])
-        self.style.configure('Dark.TSpinbox', background=UI_COLORS['entry_bg'], foreground=UI_COLORS['entry_fg'])
-        
-        # Configure LabelFrame
-        self.style.configure('Dark.TLabelframe', background=UI_COLORS['bg'], foreground=UI_COLORS['fg'])
-        self.style.configure('Dark.TLabelframe.Label', background=UI_COLORS['bg'], foreground=UI_COLORS['fg'])
+        self.configure_static_styles()
+        self.configure_font_styles(DEFAULT_FONT_SCALE)
+
+    def configure_static_styles(self):
+        """Configure the dark theme styles that do not depend on window size"""
+        for style_name, options in DARK_STYLES:
+            self.style.configure(style_name, **options)
         
         # Map active states
         self.style.map('Dark.TButton',
-                    background=[('active', UI_COLORS['button_active']),
-                                ('pressed', UI_COLORS['accent'])])
-        
-        # Banner styles with responsive fonts
-        self.style.configure('Banner.TFrame', background=UI_COLORS['banner_bg'])
-        self.style.configure('Banner.TLabel', background=UI_COLORS['banner_bg'], foreground='yellow', 
-                            font=('Calibri', banner_font_size, 'bold'))
-        self.style.configure('Version.TLabel', background=UI_COLORS['banner_bg'], foreground=UI_COLORS['fg'], 
-                            font=('Calibri', version_font_size))
-        self.style.configure('Subtitle.TLabel', background=UI_COLORS['banner_bg'], foreground=UI_COLORS['fg'], 
-                            font=('Calibri', subtitle_font_size, 'italic'))
+                    background=[('active', UI_COLORS.button_active),
+                                ('pressed', UI_COLORS.accent)])
+
+    def configure_font_styles(self, scale_factor):
+        """Configure the banner styles whose font sizes follow the window size"""
+        banner_font_size = max(24, int(32 * scale_factor)) 
+        subtitle_font_size = max(10, int(12 * scale_factor))
+        version_font_size = max(8, int(10 * scale_factor))
+        
+        self.style.configure('Banner.TLabel', font=('Calibri', banner_font_size, 'bold'))
+        self.style.configure('Version.TLabel', font=('Calibri', version_font_size))
+        self.style.configure('Subtitle.TLabel', font=('Calibri', subtitle_font_size, 'italic'))
 
     def create_widgets(self):
         """Create the GUI widgets with responsive dark theme"""
@@ -125,7 +159,7 @@ class EnergyPlusGUI:
             banner_content,
             text="Multithreading EnergyPlus Simulator",
             fg="#0051FF",
-            bg=UI_COLORS['banner_bg'],
+            bg=UI_COLORS.banner_bg,
             font=('Calibri', 12)
         )
         subtitle_label1.grid(row=1, column=0, pady=(0, 0))
@@ -137,7 +171,7 @@ class EnergyPlusGUI:
             banner_content,
             text="by Misha Brovin",
             fg="#ffffff",
-            bg=UI_COLORS['banner_bg'],
+            bg=UI_COLORS.banner_bg,
             cursor="hand2",
             font=('Calibri', 8, 'italic')
         )
@@ -189,7 +223,7 @@ class EnergyPlusGUI:
         # Compact settings layout
         ttk.Label(settings_frame, text="Max Workers:", style='Dark.TLabel').grid(
             row=0, column=0, sticky=tk.W, padx="1m", pady="0.5m")
-        ttk.Spinbox(settings_frame, from_=1, to=cpu_count(), textvariable=self.max_workers, 
+        ttk.Spinbox(settings_frame, from_=1, to=CPU_COUNT, textvariable=self.max_workers, 
                     width=5, style='Dark.TSpinbox').grid(row=0, column=1, padx="0.5m", pady="0.5m")
         
         ttk.Label(settings_frame, text="CSV Output:", style='Dark.TLabel').grid(
@@ -203,20 +237,19 @@ class EnergyPlusGUI:
         self.files_frame.columnconfigure(0, weight=1)
         self.files_frame.rowconfigure(0, weight=1)
         
-        # Scrollable frame setup
-        self.canvas = tk.Canvas(self.files_frame, bg=UI_COLORS['bg'], highlightthickness=0)
-        self.scrollbar = ttk.Scrollbar(self.files_frame, orient="vertical", command=self.canvas.yview)
-        self.scrollable_frame = ttk.Frame(self.canvas, style='Dark.TFrame')
-        
-        self.scrollable_frame.bind(
-            "<Configure>",
-            lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all"))
-        )
+        # File list: a single Treeview only draws the visible rows, unlike one widget per file
+        self.tree = ttk.Treeview(self.files_frame, columns=("selected", "file"), show="headings",
+                                 selectmode="none", style='Dark.Treeview')
+        self.tree.heading("selected", text="Run")
+        self.tree.heading("file", text="IDF File", anchor=tk.W)
+        self.tree.column("selected", width=40, stretch=False, anchor=tk.CENTER)
+        self.tree.column("file", anchor=tk.W)
+        self.tree.bind("<Button-1>", self.on_tree_click)
         
-        self.canvas.create_window((0, 0), window=self.scrollable_frame, anchor="nw")
-        self.canvas.configure(yscrollcommand=self.scrollbar.set)
+        self.scrollbar = ttk.Scrollbar(self.files_frame, orient="vertical", command=self.tree.yview)
+        self.tree.configure(yscrollcommand=self.scrollbar.set)
         
-        self.canvas.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S), padx="1m", pady="1m")
+        self.tree.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S), padx="1m", pady="1m")
         self.scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S), padx=(0, "0.5m"), pady="1m")
         
         # BUTTONS
@@ -240,16 +273,12 @@ class EnergyPlusGUI:
         # Default vals
         self.eplus_folder.set(DEFAULT_EPLUS_PATH)
         
-        # Bind window resize event for dynamic updates
-        self.root.bind('<Configure>', self.on_window_resize)
-        
     def select_idf_folder(self):
         """Select folder containing IDF files"""
         folder = filedialog.askdirectory(title="Select folder containing IDF files")
         if folder:
             self.idf_folder.set(folder)
             self.load_idf_files()
-            self.check_for_epw_file()
             
     def select_epw_file(self):
         """Select EPW weather file"""
@@ -267,50 +296,58 @@ class EnergyPlusGUI:
             self.eplus_folder.set(folder)
             
     def load_idf_files(self):
-        """Load IDF files from selected folder and create checkboxes"""
+        """Load IDF files from selected folder into the file list and auto-select an EPW file"""
         folder = self.idf_folder.get()
         if not folder:
             return
-            
-        # Clear existing checkboxes
-        for widget in self.scrollable_frame.winfo_children():
-            widget.destroy()
-        self.idf_checkboxes.clear()
         
-        # Find IDF files
-        self.idf_files = glob.glob(os.path.join(folder, "*.idf"))
-        if not self.idf_files:
-            no_files_label = ttk.Label(self.scrollable_frame, text="No IDF files found in selected folder", style='Dark.TLabel')
-            no_files_label.pack(pady="1m")
-            return
-            
-        # Create checkboxes for each IDF file with responsive spacing
-        for i, idf_file in enumerate(self.idf_files):
-            var = tk.BooleanVar(value=True)  # Default to selected
-            filename = os.path.basename(idf_file)
-            checkbox = ttk.Checkbutton(self.scrollable_frame, text=filename, variable=var, style='Dark.TCheckbutton')
-            checkbox.pack(anchor=tk.W, pady="0.3m", padx="1m", fill=tk.X)
-            self.idf_checkboxes[idf_file] = var
-            
-    def check_for_epw_file(self):
-        """Check if EPW file exists in IDF folder and auto-select it"""
-        folder = self.idf_folder.get()
-        if not folder:
+        # Skip the reload if the same folder is selected again and its contents have not changed
+        folder_key = (folder, os.stat(folder).st_mtime_ns)
+        if folder_key == self.loaded_folder_key:
             return
             
-        epw_files = glob.glob(os.path.join(folder, "*.epw"))
+        # Clear existing rows
+        self.tree.delete(*self.tree.get_children())
+        
+        # Find IDF and EPW files in a single directory pass
+        idf_files, epw_files = scan_simulation_folder(folder)
+        self.loaded_folder_key = folder_key
+        self.idf_files = idf_files
+        self.idf_selected = [True] * len(idf_files)  # Default to selected
+
         if epw_files:
             self.epw_file.set(epw_files[0])  # Use first EPW file found
+
+        if not self.idf_files:
+            self.tree.insert("", "end", values=("", "No IDF files found in selected folder"))
+            return
+            
+        # One row per IDF file, keyed by its index in self.idf_files
+        for i, idf_file in enumerate(self.idf_files):
+            self.tree.insert("", "end", iid=str(i), values=(CHECKED, os.path.basename(idf_file)))
+
+    def on_tree_click(self, event):
+        """Toggle the selection of the clicked IDF file"""
+        row = self.tree.identify_row(event.y)
+        if row.isdigit():
+            i = int(row)
+            self.idf_selected[i] = not self.idf_selected[i]
+            self.tree.set(row, "selected", CHECKED if self.idf_selected[i] else UNCHECKED)
+
+    def set_all_selected(self, selected):
+        """Set the selection of every IDF file and redraw the check column"""
+        self.idf_selected = [selected] * len(self.idf_files)
+        mark = CHECKED if selected else UNCHECKED
+        for i in range(len(self.idf_files)):
+            self.tree.set(str(i), "selected", mark)
             
     def select_all_files(self):
         """Select all IDF files"""
-        for var in self.idf_checkboxes.values():
-            var.set(True)
+        self.set_all_selected(True)
             
     def select_no_files(self):
         """Deselect all IDF files"""
-        for var in self.idf_checkboxes.values():
-            var.set(False)
+        self.set_all_selected(False)
             
     def validate_inputs(self):
         """Validate user inputs"""
@@ -326,22 +363,24 @@ class EnergyPlusGUI:
             messagebox.showerror("Error", "Please select EnergyPlus installation folder")
             return False
             
-        if not os.path.exists(self.epw_file.get()):
-            messagebox.showerror("Error", "Selected weather file does not exist")
+        problem = path_problem(self.epw_file.get())
+        if problem:
+            messagebox.showerror("Error", f"Selected weather file {problem}")
             return False
             
-        if not os.path.exists(self.eplus_folder.get()):
-            messagebox.showerror("Error", "Selected EnergyPlus folder does not exist")
-            return False
-            
-        # Check if EnergyPlus executable exists
-        eplus_exe = os.path.join(self.eplus_folder.get(), 'energyplus.exe')
-        if not os.path.exists(eplus_exe):
-            messagebox.showerror("Error", f"EnergyPlus executable not found at {eplus_exe}")
+        # Check if EnergyPlus executable exists; the folder is only looked at when it does not
+        eplus_exe = os.path.join(self.eplus_folder.get(), EPLUS_EXECUTABLE)
+        problem = path_problem(eplus_exe)
+        if problem:
+            folder_problem = path_problem(self.eplus_folder.get())
+            if folder_problem:
+                messagebox.showerror("Error", f"Selected EnergyPlus folder {folder_problem}")
+            else:
+                messagebox.showerror("Error", f"EnergyPlus executable {problem}: {eplus_exe}")
             return False
             
         # Get selected IDF files
-        self.selected_files = [idf for idf, var in self.idf_checkboxes.items() if var.get()]
+        self.selected_files = [idf for idf, selected in zip(self.idf_files, self.idf_selected) if selected]
         
         if not self.selected_files:
             messagebox.showerror("Error", "Please select at least one IDF file to run")
@@ -372,14 +411,9 @@ class EnergyPlusGUI:
         
         # Launch new process with console for simulations
         try:
-            # Get the path to the current script
-            script_path = os.path.abspath(__file__)
-            # Get the main.py path (assuming it's in the same directory)
-            main_script_path = os.path.join(os.path.dirname(script_path), 'main.py')
-            
             # Launch new process with console and config file
             subprocess.Popen([
-                sys.executable, main_script_path, 
+                sys.executable, MAIN_SCRIPT_PATH, 
                 '--run-simulations', config_file
             ], creationflags=subprocess.CREATE_NEW_CONSOLE if os.name == 'nt' else 0)
             
@@ -34,32 +34,48 @@ python energyplus_parallel.py --eplus_path "C:\EnergyPlusV23-2-0" --weather_file
 
 import os
 import sys
-import glob
 import signal
 import argparse
 
-from eP_C import APP_NAME, VERSION, DEFAULT_EPLUS_PATH
+from eP_C import APP_NAME, VERSION, DEFAULT_EPLUS_PATH, DEFAULT_MAX_DISPLAY_ROWS
 from eP_D import check_and_install_dependencies
-from eP_U import load_config_from_temp, signal_handler, cleanup_and_exit
-from eP_S import run_simulations
-from eP_G import show_gui
+from eP_U import load_config_from_temp, scan_simulation_folder, signal_handler, cleanup_and_exit
+
+
+def non_negative_int(value):
+    """argparse type for counts that may be zero but not negative"""
+    number = int(value)
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"must be 0 or more, got {value}")
+    return number
 
 
 def main():
-    signal.signal(signal.SIGINT, signal_handler)
+    # Ctrl+C is left as KeyboardInterrupt, handled by run_simulations and the entry point below
     signal.signal(signal.SIGTERM, signal_handler)
     
     check_and_install_dependencies()
     
+    # If no command line arguments are provided, launch GUI mode without building the parser
+    if len(sys.argv) == 1:
+        from eP_G import show_gui
+
+        print("No command line arguments provided. Starting GUI mode...")
+        show_gui()
+        return
+    
     parser = argparse.ArgumentParser(description='Run EnergyPlus simulations in parallel with Rich UI')
     parser.add_argument('--eplus', type=str, default=DEFAULT_EPLUS_PATH, help='Path to EnergyPlus installation directory')
     parser.add_argument('--max-workers', type=int, default=None, help='Maximum number of parallel simulations')
     parser.add_argument('--csv', type=str, default="simulation_results.csv", help='Output CSV file for simulation results')
     parser.add_argument('--weather', type=str, default=None, help='Weather file to use')
+    parser.add_argument('--max-display-rows', type=non_negative_int, default=DEFAULT_MAX_DISPLAY_ROWS, help='Maximum number of simulations listed in the status table')
     parser.add_argument('--run-simulations', type=str, default=None, help='Run simulations with config file (internal use)')
     
     args = parser.parse_args()
     
+    from eP_S import run_simulations
+    
     # Check if this is a simulation run (launched from GUI)
     if args.run_simulations:
         print(f"{APP_NAME}{VERSION} - Simulation Console")
@@ -78,42 +94,37 @@ def main():
             weather_file=config['epw_file'],
             eplus_path=config['eplus_path'],
             max_workers=config['max_workers'],
-            csv_output=config['csv_output']
+            csv_output=config['csv_output'],
+            max_display_rows=args.max_display_rows
         )
         return
     
-    # Check if any command line arguments were provided (excluding defaults)
-    # If no arguments provided, launch GUI mode
-    if len(sys.argv) == 1: # GUI mode
-        print("No command line arguments provided. Starting GUI mode...")
-        show_gui()
-        
-    else: # Command line mode
-        current_dir = os.getcwd()
-        
-        # Find all IDF files in the current directory
-        idf_files = glob.glob(os.path.join(current_dir, "*.idf"))
-        if not idf_files:
-            print(f"No IDF files found in the current directory")
+    # Command line mode
+    current_dir = os.getcwd()
+    
+    # Find all IDF and EPW files in the current directory
+    idf_files, epw_files = scan_simulation_folder(current_dir)
+    if not idf_files:
+        print(f"No IDF files found in the current directory")
+        return
+    
+    # Find weather files
+    if args.weather:
+        weather_file = args.weather
+    else:
+        if not epw_files:
+            print(f"No EPW weather files found in the current directory")
             return
-        
-        # Find weather files
-        if args.weather:
-            weather_file = args.weather
-        else:
-            epw_files = glob.glob(os.path.join(current_dir, "*.epw"))
-            if not epw_files:
-                print(f"No EPW weather files found in the current directory")
-                return
-            weather_file = epw_files[0]
-        
-        run_simulations(
-            idf_files=idf_files,
-            weather_file=weather_file,
-            eplus_path=args.eplus,
-            max_workers=args.max_workers,
-            csv_output=args.csv
-        )
+        weather_file = epw_files[0]
+    
+    run_simulations(
+        idf_files=idf_files,
+        weather_file=weather_file,
+        eplus_path=args.eplus,
+        max_workers=args.max_workers,
+        csv_output=args.csv,
+        max_display_rows=args.max_display_rows
+    )
 
 
 if __name__ == "__main__":
@@ -6,249 +6,128 @@
 import os
 import sys
 import time
-import glob
 import csv
-import queue
 import shutil
 import tempfile
-import subprocess
 import threading
 import traceback
 import multiprocessing
-from multiprocessing import Manager, Process
+from bisect import bisect_left
+from collections import deque
+from multiprocessing import Pipe, Process
+from multiprocessing.connection import wait
 
-from eP_D import import_dependencies
-from eP_T import SimulationStatus, process_monitor, update_process
-from eP_U import add_simulation_to_csv, resolve_csv_path
+from eP_C import EPLUS_EXECUTABLE, DEFAULT_MAX_DISPLAY_ROWS, CSV_HEADERS
+from eP_D import Live, Layout, psutil
+from eP_T import SimulationStatus, process_monitor, update_process, MESSAGE_PANEL_LINES
+from eP_U import add_simulation_to_csv, build_csv_row, resolve_csv_path
+from eP_W import find_auxiliary_files, simulation_worker
 
-# Import Rich components
-rich_components = import_dependencies()
-Live = rich_components['Live']
-Layout = rich_components['Layout']
-psutil = rich_components['psutil']
 
+# Maximum number of pending status messages; workers wait when the UI falls behind
+UPDATE_QUEUE_SIZE = 10000
 
-def run_energyplus_simulation(idf_file, weather_file, eplus_dir, update_queue, completed_queue=None):
+# Shortest time between two redraws of the live display (at most 10 per second)
+MIN_RENDER_INTERVAL = 0.1
+
+# Seconds between checks for simulations stuck in Initializing or running too long
+STUCK_CHECK_INTERVAL = 5
+
+# Files left out of the output summary: inputs (IDF, and a weather file sharing the prefix) and .end
+SUMMARY_EXCLUDED_SUFFIXES = ('.idf', '.epw', '.end')
+
+# Seconds the workers get to exit at shutdown, first after being asked and again after terminate()
+WORKER_EXIT_TIMEOUT = 1
+
+# Longest time the runner loop waits for a completion or a worker exit before checking status and redrawing
+LOOP_INTERVAL = 0.25
+
+
+def start_worker(update_queue, aux_files, weather_file, eplus_path):
     """
-    Run a single EnergyPlus simulation.
+    Start a persistent worker process.
     
     Args:
-        idf_file (str): Path to the IDF file
-        weather_file (str): Path to the EPW weather file
-        eplus_dir (str): Path to the EnergyPlus installation directory
         update_queue (Queue): Queue for status updates
-        completed_queue (Queue, optional): Queue for completion signals
+        aux_files (list): Auxiliary EnergyPlus files to stage for every simulation
+        weather_file (str): Absolute path to the EPW weather file
+        eplus_path (str): Absolute path to the EnergyPlus installation directory
     
     Returns:
-        None
+        dict: The worker 'process', the runner's end of its job pipe 'conn' and its 'run_dir'
     """
-    # Make sure we have absolute paths
-    idf_file = os.path.abspath(idf_file)
-    weather_file = os.path.abspath(weather_file)
-    eplus_dir = os.path.abspath(eplus_dir)
-    
-    # Get the output directory (current working directory)
-    # (same as IDF file directory)
-    try: 
-        output_dir = os.path.dirname(idf_file)
-    except: 
-        output_dir = os.getcwd()
-    
-    # Get file names
-    idf_basename = os.path.basename(idf_file)
-    idf_name = os.path.splitext(idf_basename)[0]
-    weather_basename = os.path.basename(weather_file)
+    # The runner creates the run directory, so it can still remove it if the worker dies
+    run_dir = tempfile.mkdtemp(prefix="EP_worker_")
+    conn, worker_conn = Pipe()
+    process = Process(target=simulation_worker,
+                      args=(worker_conn, update_queue, aux_files, weather_file, eplus_path, run_dir))
+    process.daemon = True
+    process.start()
+    worker_conn.close()
+    return {'process': process, 'conn': conn, 'run_dir': run_dir}
+
+
+def wait_for_exit(processes, timeout):
+    """Wait up to timeout seconds in total for processes to exit, and return those still alive"""
+    deadline = time.monotonic() + timeout
+    pending = {process.sentinel: process for process in processes}
+    while pending:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        for sentinel in wait(list(pending), timeout=remaining):
+            pending.pop(sentinel).join()
+    return list(pending.values())
+
+
+def stop_workers(workers):
+    """Ask idle workers to exit, stop any that are still busy, and remove their run directories"""
+    for worker in workers:
+        try:
+            worker['conn'].send(None)
+        except OSError:
+            pass
+    # Wait on all workers together, so shutdown takes about a second however many there are
+    still_running = wait_for_exit([worker['process'] for worker in workers], WORKER_EXIT_TIMEOUT)
+    for process in still_running:
+        process.terminate()
+    for process in wait_for_exit(still_running, WORKER_EXIT_TIMEOUT):
+        process.kill()
+        process.join()
+    # A worker removes its own run directory, unless it was stopped before it could
+    for worker in workers:
+        shutil.rmtree(worker['run_dir'], ignore_errors=True)
+
+
+def terminate_energyplus(pid, worker, eplus_exe):
+    """
+    Terminate an EnergyPlus process if it is still running under the given worker.
     
-    # Signal that we're starting
-    update_queue.put(("INFO", f"Starting simulation for {idf_basename}"))
-    update_queue.put(("UPDATE", idf_name, {'status': 'Initializing'}))
+    Args:
+        pid (int): EnergyPlus process id, or None if it never started
+        worker (dict): Worker that launched the process
+        eplus_exe (str): Absolute path to the EnergyPlus executable the worker runs
     
+    Returns:
+        psutil.Process: The terminated process, or None if there was nothing to terminate
+    """
+    if not pid:
+        return None
     try:
-        # Create a unique temporary directory for the simulation
-        temp_dir = tempfile.mkdtemp(prefix=f"EP_{idf_name}_")
-        update_queue.put(("INFO", f"Created temporary directory: {temp_dir}"))
-        
-        # Copy the IDF file to the temp directory
-        temp_idf = os.path.join(temp_dir, idf_basename)
-        shutil.copy2(idf_file, temp_idf)
-        
-        # Copy the weather file to the temp directory
-        temp_weather = os.path.join(temp_dir, weather_basename)
-        shutil.copy2(weather_file, temp_weather)
-        
-        # Copy required EnergyPlus files to the temp directory
-        energyplus_exe = os.path.join(eplus_dir, 'energyplus.exe')
-        if not os.path.exists(energyplus_exe):
-            update_queue.put(("INFO", f"Error: EnergyPlus executable not found at {energyplus_exe}"))
-            update_queue.put(("UPDATE", idf_name, {
-                'status': 'Failed (Missing EnergyPlus)',
-                'progress': 100,
-                'end_time': time.time()
-            }))
-            update_queue.put(("COMPLETED", idf_name))  # Signal completion even on error
-            if completed_queue:
-                completed_queue.put(idf_name)
-            return
-        
-        for file in ['Energy+.idd', 'DElight2.dll', 'libexpat.dll', 'bcvtb.dll']:
-            src_path = os.path.join(eplus_dir, file)
-            if os.path.exists(src_path):
-                dst_path = os.path.join(temp_dir, file)
-                shutil.copy2(src_path, dst_path)
-        
-        # Create empty Energy+.ini file
-        with open(os.path.join(temp_dir, 'Energy+.ini'), 'w') as f:
-            pass
-        
-        # Change to the temporary directory
-        original_dir = os.getcwd()
-        os.chdir(temp_dir)
-        
-        # Run EnergyPlus with the correct command line
-        cmd = [
-            energyplus_exe,
-            '-w', weather_basename, # Weather file
-            '-p', idf_name,         # Prefix for output files
-            '-d', output_dir,       # Output directory
-            '-a',                   # -a flag disables the annual simulation summary (.end file)
-            idf_basename
-        ]
-        
-        cmd_str = ' '.join(cmd)
-        update_queue.put(("INFO", f"Running command: {cmd_str}"))
-        update_queue.put(("UPDATE", idf_name, {'status': 'Running'}))
-        
-        # Start the EnergyPlus process
-        process = subprocess.Popen(
-            cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            text=True,
-            bufsize=1,
-            universal_newlines=True
-        )
-        
-        # Start a process monitor for CPU and memory
-        monitor_thread = threading.Thread(
-            target=process_monitor,
-            args=(process.pid, idf_name, update_queue)
-        )
-        monitor_thread.daemon = True
-        monitor_thread.start()
-        
-        # Variables to track fatal errors
-        fatal_error_detected = False
-        
-        # Read output in real-time and send to queue
-        for line in iter(process.stdout.readline, ''):
-            if line.strip():
-                try:
-                    update_queue.put(("LOG", idf_name, line.strip()))
-                    
-                    # Check for fatal error indicators in the output
-                    line_lower = line.lower()
-                    if '**fatal' in line_lower or 'fatal error' in line_lower or 'fatal:' in line_lower:
-                        # Immediately mark as failed
-                        update_queue.put(("UPDATE", idf_name, {
-                            'status': 'Failed (Fatal Error)',
-                            'progress': 100,  # Mark as 100% to show it's done
-                            'end_time': time.time()
-                        }))
-                        fatal_error_detected = True
-                        
-                        # Signal completion so next simulation can start
-                        update_queue.put(("COMPLETED", idf_name))
-                        if completed_queue:
-                            completed_queue.put(idf_name)
-                        
-                        # Terminate the process since we detected a fatal error
-                        try:
-                            process.terminate()
-                        except:
-                            pass
-                        break
-                    
-                    # Also check for successful completion
-                    if 'energyplus completed successfully' in line_lower:
-                        update_queue.put(("UPDATE", idf_name, {
-                            'status': 'Completed',
-                            'progress': 100,
-                            'end_time': time.time()
-                        }))
-                        update_queue.put(("COMPLETED", idf_name))
-                        if completed_queue:
-                            completed_queue.put(idf_name)
-                except:
-                    # If the queue is closed, stop sending updates
-                    break
-        
-        # If no fatal error was detected in the logs, wait for the process to complete
-        if not fatal_error_detected:
-            try:
-                process.wait(timeout=10)  # Wait up to 10 seconds for normal termination
-            except subprocess.TimeoutExpired:
-                # If it times out, force terminate
-                process.terminate()
-                try:
-                    process.wait(timeout=5)
-                except:
-                    # If it still doesn't terminate, force kill
-                    process.kill()
-            
-            # Update final status based on the return code (only if not already signaled as completed)
-            if process.returncode == 0:
-                update_queue.put(("UPDATE", idf_name, {
-                    'status': 'Completed',
-                    'progress': 100,
-                    'end_time': time.time()
-                }))
-            else:
-                update_queue.put(("UPDATE", idf_name, {
-                    'status': 'Failed (Exit code: {})'.format(process.returncode),
-                    'progress': 100,  # Mark as 100% to show it's done
-                    'end_time': time.time()
-                }))
-            
-            # Signal that this simulation is complete (for job scheduling)
-            update_queue.put(("COMPLETED", idf_name))
-            if completed_queue:
-                completed_queue.put(idf_name)
-        
-        # Change back to the original directory
-        os.chdir(original_dir)
-        
-        # Clean up the temporary directory
-        try:
-            shutil.rmtree(temp_dir, ignore_errors=True)
-        except:
-            pass
-        
-    except Exception as e:
-        # Make sure we're back in the original directory
-        try:
-            if 'original_dir' in locals():
-                os.chdir(original_dir)
-        except:
-            pass
-        
-        try:
-            update_queue.put(("INFO", f"Error running simulation for {idf_basename}: {str(e)}"))
-            update_queue.put(("UPDATE", idf_name, {
-                'status': f'Failed: {str(e)}',
-                'progress': 100,  # Mark as 100% to show it's done
-                'end_time': time.time()
-            }))
-            
-            # Signal that this simulation is complete (for job scheduling)
-            update_queue.put(("COMPLETED", idf_name))
-            if completed_queue:
-                completed_queue.put(idf_name)
-        except:
-            # If the queue is closed, we can't send updates
-            pass
+        process = psutil.Process(pid)
+        # Make sure the pid was not reused by an unrelated process. EnergyPlus is a child of its
+        # worker; once the worker has died it is orphaned and is recognized by its command line
+        if process.ppid() == worker['process'].pid or (
+                not worker['process'].is_alive() and eplus_exe in process.cmdline()):
+            process.terminate()
+            return process
+    except psutil.Error:
+        pass
+    return None
 
 
-def run_simulations(idf_files=None, weather_file=None, eplus_path=None, max_workers=None, csv_output="simulation_results.csv"):
+def run_simulations(idf_files=None, weather_file=None, eplus_path=None, max_workers=None, csv_output="simulation_results.csv",
+                    max_display_rows=DEFAULT_MAX_DISPLAY_ROWS):
     """
     Run EnergyPlus simulations in parallel with a Rich UI showing progress.
     
@@ -258,6 +137,7 @@ def run_simulations(idf_files=None, weather_file=None, eplus_path=None, max_work
         eplus_path (str): Path to the EnergyPlus installation directory
         max_workers (int): Maximum number of parallel simulations
         csv_output (str): Name of the CSV output file for results summary
+        max_display_rows (int): Maximum number of simulations listed in the status table
     """
     if not idf_files:
         print("No IDF files provided")
@@ -267,464 +147,367 @@ def run_simulations(idf_files=None, weather_file=None, eplus_path=None, max_work
         print("Invalid weather file provided")
         return
     
+    # Resolve the paths once; workers get them at startup and only receive IDF paths afterwards
+    weather_file = os.path.abspath(weather_file)
+    eplus_path = os.path.abspath(eplus_path)
+    eplus_exe = os.path.join(eplus_path, EPLUS_EXECUTABLE)
+    if not os.path.isfile(eplus_exe):
+        print(f"EnergyPlus executable not found at {eplus_exe}")
+        return
+    
     # Resolve the CSV output path
     csv_output = resolve_csv_path(csv_output, idf_files)
     
-    # Initialize CSV file with headers
-    if csv_output:
-        with open(csv_output, 'w', newline='') as f:
-            writer = csv.writer(f)
-            writer.writerow([
-                "#", "Job_ID", "WeatherFile", "ModelFile", "Progress(1-Completed/0-Failed)", 
-                "Message", "Warnings", "Errors", "Hours", "Minutes", "Seconds"
-            ])
-        print(f"Initialized CSV results file: {csv_output}")
-    
-    # Determine the number of logical processors
-    available_cores = psutil.cpu_count(logical=True)
-    
-    # Set the maximum number of workers
-    if max_workers is None:
-        max_workers = max(1, available_cores - 1)  # Leave one core free
-    max_workers = min(max_workers, len(idf_files))
-    
-    print(f"Found {len(idf_files)} IDF files:")
-    for idf in idf_files:
-        print(f"  - {os.path.basename(idf)}")
+    csv_file = None
+    csv_writer = None
+    workers = []
+    stop_event = threading.Event()  # Ends the update thread
     
-    print(f"Using weather file: {os.path.basename(weather_file)}")
-    print(f"Using EnergyPlus: {eplus_path}")
-    print(f"Running with {max_workers} parallel processes (out of {available_cores} logical processors)")
-    
-    # Create a status tracker
-    status_tracker = SimulationStatus()
-    
-    # Create a layout for the UI
-    layout = Layout()
-    layout.split(
-        Layout(name="stats"),  # Removed fixed size to auto-adjust
-        Layout(name="logs")
-    )
-    
-    # Register all simulations with status "Waiting"
-    for idf_file in idf_files:
-        idf_name = os.path.splitext(os.path.basename(idf_file))[0]
-        status_tracker.add_simulation(idf_name)
-    
-    # Create a manager for sharing data between processes
+    # Set-up; an error or Ctrl-C here still stops the workers already started and closes the CSV file
     try:
-        multiprocessing.set_start_method('spawn', force=True)
-    except RuntimeError:
-        # Method already set
-        pass
-    
-    manager = Manager()
-    update_queue = manager.Queue()
-    completed_queue = manager.Queue()  # Separate queue for completion signals
-    
-    # Start update process
-    update_thread = threading.Thread(target=update_process, args=(update_queue, status_tracker))
-    update_thread.daemon = True
-    update_thread.start()
-    
-    # Prepare process tracking
-    active_processes = {}  # Maps idf_name to its Process object
-    waiting_files = list(idf_files)  # List of files waiting to be processed
-    completed_count = 0  # Count of completed simulations
-    total = len(idf_files)  # Total number of simulations
-    last_check_time = time.time()  # Time of last process check
-
-    row_counter = 0 # For CSV row numbering
-    
-    # Track which simulations have been written to CSV
-    csv_written = set()
-    
-    # Start initial batch of simulations
-    for i in range(min(max_workers, len(waiting_files))):
-        idf_file = waiting_files.pop(0)
-        idf_name = os.path.splitext(os.path.basename(idf_file))[0]
+        # Initialize CSV file with headers; it stays open for the whole run, and the rows of each
+        # loop pass are flushed together
+        if csv_output:
+            csv_file = open(csv_output, 'w', newline='')
+            csv_writer = csv.writer(csv_file)
+            csv_writer.writerow(CSV_HEADERS)
+            print(f"Initialized CSV results file: {csv_output}")
+        
+        # Determine the number of logical processors
+        available_cores = os.cpu_count() or 1
+        
+        # Set the maximum number of workers
+        if max_workers is None:
+            max_workers = max(1, available_cores - 1)  # Leave one core free
+        max_workers = min(max_workers, len(idf_files))
+        
+        # Use spawn for the worker processes on every platform
+        try:
+            multiprocessing.set_start_method('spawn', force=True)
+        except RuntimeError:
+            # Method already set
+            pass
+        
+        # Workers only send messages; the status tracker lives in this process. The queue is
+        # pipe-backed, since a Manager queue costs a round trip to the manager process per message
+        update_queue = multiprocessing.Queue(maxsize=UPDATE_QUEUE_SIZE)
+        
+        # Look up the auxiliary EnergyPlus files once for all simulations
+        aux_files = find_auxiliary_files(eplus_path)
+        
+        # Start the persistent workers now, so their interpreter startup overlaps with the rest of the
+        # set-up and they are ready for the first simulations; they stay alive for the whole batch
+        for _ in range(max_workers):
+            workers.append(start_worker(update_queue, aux_files, weather_file, eplus_path))
+        
+        # Simulation names (IDF file names without extension) and absolute IDF paths, computed once for
+        # the whole run; workers use the paths as sent
+        idf_files = [os.path.abspath(idf_file) for idf_file in idf_files]
+        idf_basenames = [os.path.basename(idf_file) for idf_file in idf_files]
+        idf_names = [os.path.splitext(basename)[0] for basename in idf_basenames]
+        basename_of = dict(zip(idf_names, idf_basenames))
+        weather_base = os.path.basename(weather_file)
         
-        # Create and start the process
-        process = Process(
-            target=run_energyplus_simulation,
-            args=(idf_file, weather_file, eplus_path, update_queue, completed_queue)
+        print(f"Found {len(idf_files)} IDF files:")
+        for basename in idf_basenames:
+            print(f"  - {basename}")
+        
+        print(f"Using weather file: {weather_base}")
+        print(f"Using EnergyPlus: {eplus_path}")
+        print(f"Running with {max_workers} parallel processes (out of {available_cores} logical processors)")
+        
+        # Create a status tracker
+        status_tracker = SimulationStatus()
+        
+        # Create a layout for the UI
+        layout = Layout()
+        layout.split(
+            Layout(name="stats"),  # Removed fixed size to auto-adjust
+            Layout(name="logs"),
+            Layout(name="messages", size=MESSAGE_PANEL_LINES + 2)  # Message lines plus the panel border
         )
-        process.start()
         
-        # Track the process
-        active_processes[idf_name] = {
-            'process': process,
-            'start_time': time.time(),
-            'file': idf_file
-        }
+        # Register all simulations with status "Waiting"
+        for idf_name in idf_names:
+            status_tracker.add_simulation(idf_name)
+        
+        # Names of finished simulations, passed on by the update thread once their final status is applied.
+        # A pipe rather than a queue, so the runner can wait on it together with the worker sentinels
+        completed_conn, update_conn = Pipe(duplex=False)
+        
+        # Start update process; stop_event ends it once the workers are gone and the queue is empty
+        update_thread = threading.Thread(target=update_process, args=(update_queue, status_tracker, update_conn, stop_event))
+        update_thread.daemon = True
+        update_thread.start()
+        
+        # Start a single monitor for CPU and memory of all running simulations
+        monitor_thread = threading.Thread(target=process_monitor, args=(status_tracker,))
+        monitor_thread.daemon = True
+        monitor_thread.start()
+        
+        # Prepare process tracking
+        active_processes = {}  # Maps idf_name to the worker running it
+        waiting_files = deque(zip(idf_names, idf_files))  # (name, file) pairs waiting to be processed
+        completed_count = 0  # Count of completed simulations
+        total = len(idf_files)  # Total number of simulations
+        # Loop bookkeeping uses the monotonic clock; the tracker's start and end times stay wall-clock
+        next_check_time = time.monotonic() + STUCK_CHECK_INTERVAL  # When stuck simulations are checked next
+        last_render_time = 0  # Time the UI was last redrawn
+        rendered_count = 0  # Completed count shown by the last redraw
+        
+        # CSV row numbering; a simulation's row is written when it leaves active_processes, which
+        # happens once, so no separate record of written simulations is needed
+        row_counter = 0
+        flushed_rows = 0  # Rows written to the CSV file by the last flush
+        
+        # Worker tracking
+        idle_workers = list(workers)  # Workers without a simulation assigned
+        sentinels = {worker['process'].sentinel: worker for worker in workers}  # Ready once a worker exits
+    except BaseException:
+        stop_event.set()
+        stop_workers(workers)
+        if csv_file:
+            csv_file.close()
+        raise
     
     # Display live UI updates
     try:
-        with Live(layout, refresh_per_second=4) as live:
+        with Live(layout, auto_refresh=False) as live:
             # Continue until all simulations are done
             while active_processes or waiting_files:
-                # Process messages in the update queue first to update statuses
-                try:
-                    while True:
-                        message = update_queue.get_nowait()
-                        if message == "DONE":
-                            break
-                        
-                        message_type = message[0]
-                        
-                        if message_type == "INFO":
-                            print(message[1])
-                        
-                        elif message_type == "UPDATE":
-                            idf_name = message[1]
-                            updates = message[2]
-                            
-                            # Check if this is a status update to Failed
-                            is_failure_update = False
-                            if 'status' in updates and (updates['status'] == 'Failed' or 
-                                                        updates['status'].startswith('Failed (')):
-                                is_failure_update = True
-                                print(f"⚠️ Detected failure for {idf_name}: {updates['status']}")
-                            
-                            # Update status tracker
-                            status_tracker.update_simulation(idf_name, **updates)
-                            
-                            # If status was updated to Failed and has 'end_time', write to CSV immediately
-                            if is_failure_update and 'end_time' in updates and idf_name not in csv_written and idf_name in active_processes:
-                                info = status_tracker.simulations[idf_name]
-                                if csv_output:
-                                    add_simulation_to_csv(active_processes[idf_name]['file'], weather_file, info, row_counter, csv_output)
-                                    csv_written.add(idf_name)
-                                    row_counter += 1
-                        
-                        elif message_type == "LOG":
-                            idf_name = message[1]
-                            log_message = message[2]
-                            status_tracker.add_log(idf_name, log_message)
-                            
-                            # Check if this log message indicates a fatal error
-                            log_lower = log_message.lower()
-                            if ('**fatal' in log_lower or 'fatal error' in log_lower or 'fatal:' in log_lower) and idf_name in active_processes:
-                                # Force status update to Failed
-                                status_tracker.update_simulation(idf_name, status='Failed (Fatal Error)', progress=100)
-                                
-                                # If not already written to CSV, write now
-                                if idf_name not in csv_written and csv_output:
-                                    info = status_tracker.simulations[idf_name]
-                                    add_simulation_to_csv(active_processes[idf_name]['file'], weather_file, info, row_counter, csv_output)
-                                    csv_written.add(idf_name)
-                                    row_counter += 1
-                        
-                        # Don't handle COMPLETED messages here - let the next section do that
-                        elif message_type != "COMPLETED":
-                            update_queue.put(message)
-                
-                except queue.Empty:
-                    pass
+                # Hand waiting simulations to idle workers
+                while idle_workers and waiting_files:
+                    worker = idle_workers.pop()
+                    next_name, next_file = waiting_files.popleft()
+                    
+                    try:
+                        worker['conn'].send(next_file)
+                    except OSError:
+                        # The worker died while idle; the simulation waits for another worker, and
+                        # the dead one is replaced once its sentinel is seen
+                        waiting_files.appendleft((next_name, next_file))
+                        continue
+                    
+                    # Track the simulation
+                    active_processes[next_name] = {
+                        'worker': worker,
+                        'start_time': time.monotonic(),
+                        'file': next_file
+                    }
                 
-                # Check for completed processes from the completion queue
+                # Wait for completion signals or a worker exiting; waiting here also paces the loop.
+                # Status updates and logs are applied by the update thread, the only reader of update_queue
+                ready = wait([completed_conn, *sentinels], timeout=LOOP_INTERVAL)
                 completed_names = []
-                try:
-                    while True:
-                        completed_name = completed_queue.get_nowait()
-                        if completed_name:
-                            completed_names.append(completed_name)
-                except queue.Empty:
-                    pass
-                
-                # Also check for COMPLETED messages in the update queue
-                try:
-                    while True:
-                        message = update_queue.get_nowait()
-                        if message[0] == "COMPLETED":
-                            completed_name = message[1]
-                            if completed_name not in completed_names:
-                                completed_names.append(completed_name)
-                        else:
-                            update_queue.put(message)
-                except queue.Empty:
-                    pass
+                while completed_conn.poll():
+                    completed_names.extend(completed_conn.recv())
                 
                 # Process all COMPLETED signals
                 for name in completed_names:
-                    if name in active_processes:
-                        process_info = active_processes[name]
-                        process = process_info['process']
-                        
-                        # Try to terminate/cleanup the process
-                        try:
-                            if process.is_alive():
-                                process.terminate()
-                                process.join(timeout=0.5)
-                        except:
-                            pass
-                        
-                        # Write to CSV if the simulation has completed or failed and hasn't been written yet
-                        if name in status_tracker.simulations and name not in csv_written and csv_output:
+                    # Remove from active processes; signals for simulations already handled as failed are skipped
+                    process_info = active_processes.pop(name, None)
+                    if process_info:
+                        # Write to CSV no matter what the status is - we're capturing completion
+                        if csv_writer:
                             info = status_tracker.simulations[name]
-                            # Write to CSV no matter what the status is - we're capturing completion
-                            add_simulation_to_csv(process_info['file'], weather_file, info, row_counter, csv_output)
-                            csv_written.add(name)
+                            add_simulation_to_csv(csv_writer, name, basename_of[name], weather_base, info, row_counter)
                             row_counter += 1
                         
-                        # Remove from active processes
-                        del active_processes[name]
+                        # The worker takes the next simulation
+                        idle_workers.append(process_info['worker'])
                         completed_count += 1
                         
-                        print(f"Completed simulation: {name}")
-                        
-                        # Start a new simulation if any are waiting
-                        if waiting_files:
-                            next_file = waiting_files.pop(0)
-                            next_name = os.path.splitext(os.path.basename(next_file))[0]
-                            
-                            # Create and start the process
-                            process = Process(
-                                target=run_energyplus_simulation,
-                                args=(next_file, weather_file, eplus_path, update_queue, completed_queue)
-                            )
-                            process.start()
-                            
-                            # Track the process
-                            active_processes[next_name] = {
-                                'process': process,
-                                'start_time': time.time(),
-                                'file': next_file
-                            }
-                            
-                            print(f"Started new simulation: {next_name}")
+                        status_tracker.add_message(f"Completed simulation: {name}")
                 
-                # Check for simulations that have changed status to Failed
-                failed_names = []
-                for name, info in status_tracker.simulations.items():
-                    if name in active_processes and (info['status'] == 'Failed' or info['status'].startswith('Failed (')):
-                        failed_names.append(name)
+                # Simulations that have changed status to Failed since the last pass
+                failed_names = [name for name in status_tracker.pop_failed() if name in active_processes]
+                now = time.monotonic()
                 
-                # Process any newly failed simulations
-                for name in failed_names:
-                    if name in active_processes:
-                        process_info = active_processes[name]
-                        process = process_info['process']
-                        
-                        # Write to CSV if status has changed to Failed and hasn't been written yet
-                        if name not in csv_written and csv_output:
-                            info = status_tracker.simulations[name]
-                            add_simulation_to_csv(process_info['file'], weather_file, info, row_counter, csv_output)
-                            csv_written.add(name)
-                            row_counter += 1
-                        
-                        print(f"Process for {name} has failed - terminating")
-                        
-                        # Try to terminate/cleanup the process
-                        try:
-                            if process.is_alive():
-                                process.terminate()
-                                process.join(timeout=0.5)
-                        except:
-                            pass
-                        
-                        # Remove from active processes
-                        del active_processes[name]
-                        completed_count += 1
-                        
-                        # Start a new simulation if any are waiting
-                        if waiting_files:
-                            next_file = waiting_files.pop(0)
-                            next_name = os.path.splitext(os.path.basename(next_file))[0]
-                            
-                            # Create and start the process
-                            process = Process(
-                                target=run_energyplus_simulation,
-                                args=(next_file, weather_file, eplus_path, update_queue, completed_queue)
-                            )
-                            process.start()
-                            
-                            # Track the process
-                            active_processes[next_name] = {
-                                'process': process,
-                                'start_time': time.time(),
-                                'file': next_file
-                            }
-                            
-                            print(f"Started new simulation: {next_name}")
+                # A worker that died takes its simulation with it; replace the worker
+                orphaned = set()  # Simulations whose worker died, already stopped and replaced
+                for sentinel in ready:
+                    if sentinel is completed_conn:
+                        continue
+                    worker = sentinels.pop(sentinel)
+                    new_worker = start_worker(update_queue, aux_files, weather_file, eplus_path)
+                    sentinels[new_worker['process'].sentinel] = new_worker
+                    workers[workers.index(worker)] = new_worker
+                    
+                    name = next((name for name, process_info in active_processes.items()
+                                 if process_info['worker'] is worker), None)
+                    if name is None:
+                        # The worker died idle; a failed dispatch has already taken it off idle_workers
+                        if worker in idle_workers:
+                            idle_workers.remove(worker)
+                        idle_workers.append(new_worker)
+                        shutil.rmtree(worker['run_dir'], ignore_errors=True)
+                        continue
+                    
+                    status_tracker.add_message(f"Worker for {name} is no longer alive - marking failed")
+                    if status_tracker.simulations[name]['status'] in ('Waiting', 'Initializing', 'Running'):
+                        status_tracker.update_simulation(name, status='Failed (Process died)', progress=100, end_time=time.time())
+                    
+                    # Stop the EnergyPlus process the dead worker left behind and remove its run directory;
+                    # the replacement takes the slot
+                    stopped = terminate_energyplus(status_tracker.simulations[name]['pid'], worker, eplus_exe)
+                    if stopped:
+                        psutil.wait_procs([stopped], timeout=WORKER_EXIT_TIMEOUT)
+                    shutil.rmtree(worker['run_dir'], ignore_errors=True)
+                    idle_workers.append(new_worker)
+                    orphaned.add(name)
+                    if name not in failed_names:
+                        failed_names.append(name)
                 
-                # Periodic check for dead or completed processes (every 5 seconds)
-                current_time = time.time()
-                if current_time - last_check_time > 5:
+                # Periodic check for stuck simulations (every STUCK_CHECK_INTERVAL seconds)
+                if now >= next_check_time:
                     # Check if any simulation with errors is still marked as Initializing instead of Failed
-                    for name, info in status_tracker.simulations.items():
-                        if name in active_processes and info['status'] == 'Initializing' and info['errors'] > 0:
+                    for name in active_processes:
+                        info = status_tracker.simulations[name]
+                        if info['status'] == 'Initializing' and info['errors'] > 0:
                             # Force update to Failed
-                            print(f"⚠️ Forcing status update for {name} from Initializing to Failed due to errors")
+                            status_tracker.add_message(f"⚠️ Forcing status update for {name} from Initializing to Failed due to errors")
                             status_tracker.update_simulation(name, status='Failed', progress=100, cpu=0.0, memory=0.0)
                             
                             # Add to failed_names to be processed immediately
                             if name not in failed_names:
                                 failed_names.append(name)
                     
-                    # Scan active processes for any that have completed or failed
-                    to_remove = []
                     for name, process_info in active_processes.items():
-                        process = process_info['process']
-                        
-                        # Check if process is still alive
-                        if not process.is_alive():
-                            to_remove.append(name)
-                            print(f"Process for {name} is no longer alive - marking completed")
-                            
-                            # Check if status is still Initializing but process is dead - mark as Failed
-                            if name in status_tracker.simulations and status_tracker.simulations[name]['status'] == 'Initializing':
-                                status_tracker.update_simulation(name, status='Failed (Process died)', progress=100, cpu=0.0, memory=0.0)
-                            
-                            # Write to CSV for dead processes if not already written
-                            if name in status_tracker.simulations and name not in csv_written and csv_output:
-                                info = status_tracker.simulations[name]
-                                add_simulation_to_csv(process_info['file'], weather_file, info, row_counter, csv_output)
-                                csv_written.add(name)
-                                row_counter += 1
-                        
                         # Check for excessively long-running simulations (1 hour)
-                        if current_time - process_info['start_time'] > 3600:
-                            if name not in to_remove:
-                                to_remove.append(name)
-                                print(f"Simulation {name} has been running for over 1 hour - marking as failed")
-                                status_tracker.update_simulation(name, {
-                                    'status': 'Failed (Timeout)',
-                                    'progress': 100,
-                                    'end_time': current_time,
-                                    'cpu': 0.0,
-                                    'memory': 0.0
-                                })
-                                
-                                # Wait for status update to be processed
-                                time.sleep(0.1)
-                                
-                                # Write to CSV for timed-out processes if not already written
-                                if name in status_tracker.simulations and name not in csv_written and csv_output:
-                                    info = status_tracker.simulations[name]
-                                    add_simulation_to_csv(process_info['file'], weather_file, info, row_counter, csv_output)
-                                    csv_written.add(name)
-                                    row_counter += 1
+                        if now - process_info['start_time'] > 3600 and name not in failed_names:
+                            status_tracker.add_message(f"Simulation {name} has been running for over 1 hour - marking as failed")
+                            status_tracker.update_simulation(
+                                name, status='Failed (Timeout)', progress=100, end_time=time.time()
+                            )
+                            failed_names.append(name)
                     
-                    # Handle all identified processes
-                    for name in to_remove:
-                        if name in active_processes:
-                            process_info = active_processes[name]
-                            process = process_info['process']
-                            
-                            # Try to terminate/cleanup the process
-                            try:
-                                if process.is_alive():
-                                    process.terminate()
-                                    process.join(timeout=0.5)
-                            except:
-                                pass
-                            
-                            # Remove from active processes
-                            del active_processes[name]
-                            completed_count += 1
-                            
-                            # Start a new simulation if any are waiting
-                            if waiting_files:
-                                next_file = waiting_files.pop(0)
-                                next_name = os.path.splitext(os.path.basename(next_file))[0]
-                                
-                                # Create and start the process
-                                process = Process(
-                                    target=run_energyplus_simulation,
-                                    args=(next_file, weather_file, eplus_path, update_queue, completed_queue)
-                                )
-                                process.start()
-                                
-                                # Track the process
-                                active_processes[next_name] = {
-                                    'process': process,
-                                    'start_time': time.time(),
-                                    'file': next_file
-                                }
-                                
-                                print(f"Started new simulation: {next_name}")
+                    # Schedule the next check
+                    next_check_time = now + STUCK_CHECK_INTERVAL
+                
+                # Process any failed simulations
+                for name in failed_names:
+                    process_info = active_processes.pop(name)
+                    
+                    # Write to CSV now that the status has changed to Failed
+                    if csv_writer:
+                        info = status_tracker.simulations[name]
+                        add_simulation_to_csv(csv_writer, name, basename_of[name], weather_base, info, row_counter)
+                        row_counter += 1
+                    
+                    completed_count += 1
+                    if name in orphaned:
+                        continue
                     
-                    # Update the check time
-                    last_check_time = current_time
+                    status_tracker.add_message(f"Simulation {name} has failed - stopping EnergyPlus")
+                    
+                    # Stop EnergyPlus if it is still running; the worker then moves on
+                    terminate_energyplus(status_tracker.simulations[name]['pid'], process_info['worker'], eplus_exe)
+                    idle_workers.append(process_info['worker'])
                 
-                # Update the UI components
-                layout["stats"].update(status_tracker.get_table(completed_count, total))
-                layout["logs"].update(status_tracker.get_logs_panel())
+                # Flush the rows written in this pass in one write, so results survive a crash
+                if csv_writer and row_counter != flushed_rows:
+                    csv_file.flush()
+                    flushed_rows = row_counter
                 
-                # Short delay before next update
-                time.sleep(0.25)
+                # Redraw the UI when something changed, and at least once a second for the runtimes.
+                # A burst of completions wakes the loop repeatedly, so redraws are also rate limited;
+                # the changed flags are left set until the next redraw is allowed
+                since_render = now - last_render_time
+                if since_render >= MIN_RENDER_INTERVAL:
+                    changed, logs_changed = status_tracker.pop_changed()
+                    if changed or since_render >= 1:
+                        layout["stats"].update(status_tracker.get_table(completed_count, total, max_display_rows))
+                        # The panels below the table are rebuilt only when their content changed
+                        if logs_changed:
+                            layout["logs"].update(status_tracker.get_logs_panel())
+                            layout["messages"].update(status_tracker.get_messages_panel())
+                        live.refresh()
+                        last_render_time = now
+                        rendered_count = completed_count
             
-            # Final update
-            layout["stats"].update(status_tracker.get_table(completed_count, total))
-            layout["logs"].update(status_tracker.get_logs_panel())
+            # Final update, skipped when the last redraw already shows the finished batch
+            changed, logs_changed = status_tracker.pop_changed()
+            if changed or completed_count != rendered_count:
+                layout["stats"].update(status_tracker.get_table(completed_count, total, max_display_rows))
+                if logs_changed:
+                    layout["logs"].update(status_tracker.get_logs_panel())
+                    layout["messages"].update(status_tracker.get_messages_panel())
+                live.refresh()
     
     except KeyboardInterrupt:
         print("\nUser interrupted. Cleaning up...")
-        # Terminate all active processes
-        for process_info in active_processes.values():
-            process_info['process'].terminate()
+        # Terminate all workers
+        for worker in workers:
+            worker['process'].terminate()
     except Exception as e:
         print(f"\nError in main loop: {str(e)}")
         traceback.print_exc()
     finally:
-        # Clean up processes
-        for process_info in active_processes.values():
-            process = process_info['process']
-            if process.is_alive():
-                process.terminate()
-                process.join(timeout=1)
+        stop_workers(workers)
         
-        # Signal update thread to end
-        try:
-            update_queue.put("DONE")
-        except:
-            pass
+        # Signal update thread to end, and let it apply the last updates before the final CSV pass
+        stop_event.set()
+        update_thread.join(timeout=5)
         
-        # Ensure all simulations are written to CSV
-        if csv_output:
-            for idf_file in idf_files:
-                idf_name = os.path.splitext(os.path.basename(idf_file))[0]
-                if idf_name not in csv_written and idf_name in status_tracker.simulations:
-                    info = status_tracker.simulations[idf_name]
-                    add_simulation_to_csv(idf_file, weather_file, info, len(csv_written), csv_output)
-                    csv_written.add(idf_name)
+        # Ensure all simulations are written to CSV: those still active or waiting after an interruption
+        if csv_writer:
+            unwritten = list(active_processes) + [name for name, _ in waiting_files]
+            rows = [
+                build_csv_row(idf_name, basename_of[idf_name], weather_base, status_tracker.simulations[idf_name], row_counter + i)
+                for i, idf_name in enumerate(unwritten)
+            ]
+            row_counter += len(rows)
+            
+            # Write the remaining rows in one go and flush them once, on close
+            csv_writer.writerows(rows)
+            csv_file.close()
+    
+    # Final summary and output file listing, built in one pass over the simulations and then
+    # written at once rather than printed line by line
+    summary_lines = []
+    output_lines = []
+    dir_listings = {}  # Output directory -> sorted file names, listed once per directory
+    for idf_name, idf_file in zip(idf_names, idf_files):
+        info = status_tracker.simulations.get(idf_name)
+        if info:
+            runtime = 0
+            if info['start_time'] and info['end_time']:
+                runtime = info['end_time'] - info['start_time']
+            runtime_str = f"{int(runtime // 60)}m {int(runtime % 60)}s"
+            summary_lines.append(f"{idf_name}: {info['status']} in {runtime_str} - Warnings: {info['warnings']}, Errors: {info['errors']}\n")
+        
+        # Check for output files
+        output_dir = os.path.dirname(idf_file) or os.getcwd()
+        if output_dir not in dir_listings:
+            # scandir reports the entry type with the name, so subdirectories are skipped without a stat
+            with os.scandir(output_dir) as entries:
+                dir_listings[output_dir] = sorted(entry.name for entry in entries if entry.is_file())
+        files = dir_listings[output_dir]
+        output_lines.append(f"Files for {idf_name}:\n")
+        found_files = False
+        # Names starting with idf_name are adjacent in the sorted listing, beginning at the bisection point
+        for i in range(bisect_left(files, idf_name), len(files)):
+            file = files[i]
+            if not file.startswith(idf_name):
+                break
+            if not file.endswith(SUMMARY_EXCLUDED_SUFFIXES):
+                output_lines.append(f"  - {file}\n")
+                found_files = True
+        if not found_files:
+            output_lines.append("  No output files found\n")
     
-    # Final summary
     print("\nAll simulations completed!")
     print("Output files have been saved to the original directory.")
     
     print("\nSimulation Summary:")
     print("-" * 80)
-    for idf_file in idf_files:
-        idf_name = os.path.splitext(os.path.basename(idf_file))[0]
-        if idf_name in status_tracker.simulations:
-            info = status_tracker.simulations[idf_name]
-            runtime = 0
-            if info['start_time'] and info['end_time']:
-                runtime = info['end_time'] - info['start_time']
-            runtime_str = f"{int(runtime // 60)}m {int(runtime % 60)}s"
-            print(f"{idf_name}: {info['status']} in {runtime_str} - Warnings: {info['warnings']}, Errors: {info['errors']}")
+    sys.stdout.write(''.join(summary_lines))
     print("-" * 80)
     
-    # Check for output files
     print("\nOutput files created:")
-    for idf_file in idf_files:
-        idf_name = os.path.splitext(os.path.basename(idf_file))[0]
-        try: 
-            output_dir = os.path.dirname(idf_file)
-        except: 
-            output_dir = os.getcwd()
-        print(f"Files for {idf_name}:")
-        found_files = False
-        for file in os.listdir(output_dir):
-            if file.startswith(idf_name) and not file.endswith('.idf') and not file.endswith('.end'):
-                print(f"  - {file}")
-                found_files = True
-        if not found_files:
-            print("  No output files found")
-            
-    print(f"\nResults CSV has been saved to: {csv_output} ({len(csv_written)} simulations recorded)")
+    sys.stdout.write(''.join(output_lines))
+    
+    print(f"\nResults CSV has been saved to: {csv_output} ({row_counter} simulations recorded)")
     
     # Keep console open for user to see results
     input("\nPress Enter to exit...")
\ No newline at end of file
@@ -5,17 +5,70 @@
 
 import time
 import threading
-import queue
-from eP_D import import_dependencies
+from collections import deque
+from itertools import chain, islice
+from eP_C import LOG_LINES
+from eP_D import Table, Panel, Columns, Text, box, psutil
+from eP_U import drain_queue
+from eP_W import scan_log_line
 
-# Import Rich components
-rich_components = import_dependencies()
-Table = rich_components['Table']
-Panel = rich_components['Panel']
-Columns = rich_components['Columns']
-Text = rich_components['Text']
-box = rich_components['box']
-psutil = rich_components['psutil']
+# Seconds between CPU/memory samples of running simulations
+MONITOR_INTERVAL = 2.0
+
+# Seconds the update thread waits for messages before checking whether it should stop
+STOP_CHECK_INTERVAL = 0.1
+
+# Most recent runner and worker messages kept while the live display is up
+MESSAGE_LOG_SIZE = 200
+
+# Messages shown in the panel below the simulation logs
+MESSAGE_PANEL_LINES = 8
+
+# Every failure status starts with this, e.g. 'Failed (Exit code: 1)'
+FAILED_PREFIX = 'Failed'
+
+# Table order: failed first, then running, then waiting, then completed
+STATUS_RANK = {'Running': 1, 'Initializing': 1, 'Waiting': 2}
+FAILED_RANK = 0
+OTHER_RANK = 3
+
+# Message types applied to the status tracker by the update thread
+TRACKER_MESSAGES = ('UPDATE', 'LOG', 'LOG_BATCH', 'INFO')
+
+# Status colors in the table; any other status (a failure) is red
+STATUS_COLORS = {'Waiting': 'yellow', 'Initializing': 'green', 'Running': 'green', 'Completed': 'blue'}
+
+# Status table columns: (header, style)
+TABLE_COLUMNS = (
+    ("Simulation", "cyan"),
+    ("Status", "green"),
+    ("Progress", "magenta"),
+    ("CPU %", "yellow"),
+    ("Memory", "yellow"),
+    ("Warnings", "yellow"),
+    ("Errors", "red"),
+    ("Runtime", "blue"),
+)
+
+# Progress bar pieces, sliced instead of rebuilt for every row
+PROGRESS_FILL = '#' * 20
+PROGRESS_EMPTY = ' ' * 20
+
+
+def status_rank(status):
+    """Table position of a status: failed first, then running, waiting and completed"""
+    return FAILED_RANK if status.startswith(FAILED_PREFIX) else STATUS_RANK.get(status, OTHER_RANK)
+
+
+def format_progress(progress):
+    """Render the progress column; a Text object so the brackets are never parsed as markup"""
+    filled = progress // 5
+    return Text(f"[{PROGRESS_FILL[:filled]}{PROGRESS_EMPTY[filled:]}] {progress}%")
+
+
+def format_status(status):
+    """Render the status column in its color"""
+    return Text(status, style=STATUS_COLORS.get(status, 'red'))
 
 
 class SimulationStatus:
@@ -23,6 +76,13 @@ class SimulationStatus:
     def __init__(self):
         self.simulations = {}
         self._lock = threading.Lock()
+        # Simulation names grouped by table position; dicts keep insertion order and remove in O(1)
+        self._buckets = [{} for _ in range(OTHER_RANK + 1)]
+        self._ranks = {}  # idf_name -> index of its bucket
+        self._changed = True  # Set whenever anything shown in the UI changes
+        self._logs_changed = True  # Set when the log or messages panels change
+        self._failed = []  # Simulations that turned Failed since the last pop_failed()
+        self.messages = deque(maxlen=MESSAGE_LOG_SIZE)  # Runner and worker messages, oldest first
     
     def add_simulation(self, idf_name):
         """Add a new simulation to track"""
@@ -32,87 +92,207 @@ class SimulationStatus:
                 'progress': 0,
                 'cpu': 0,
                 'memory': 0,
-                'log': [],
+                'log': deque(maxlen=LOG_LINES),  # Last LOG_LINES (line, style) pairs
                 'start_time': None,  # Will be set when simulation actually starts
                 'end_time': None,
                 'errors': 0,
                 'warnings': 0,
-                'process': None
+                'pid': None,  # EnergyPlus process id, reported by the worker
+                'progress_text': format_progress(0),  # Table cells, re-rendered only on change
+                'status_text': format_status('Waiting')
             }
+            rank = status_rank('Waiting')
+            self._buckets[rank][idf_name] = None
+            self._ranks[idf_name] = rank
+            self._changed = True
     
     def update_simulation(self, idf_name, **kwargs):
         """Update status of a simulation"""
         with self._lock:
-            if idf_name in self.simulations:
-                if 'status' in kwargs: # RESET cpu AND memory usage UPON COMPLETION
-                    status = kwargs['status']
-                    if status == 'Completed' or status.startswith('Failed'):
-                        kwargs['cpu'] = 0.0
-                        kwargs['memory'] = 0.0
-                self.simulations[idf_name].update(kwargs)
-                
-                # If start_time is being set for the first time, set it
-                if 'status' in kwargs and kwargs['status'] == 'Running' and not self.simulations[idf_name]['start_time']:
-                    self.simulations[idf_name]['start_time'] = time.time()
+            self._apply_update(idf_name, kwargs)
+    
+    def _apply_update(self, idf_name, updates):
+        """Apply a status update; the caller must hold the lock"""
+        if idf_name in self.simulations:
+            # A failure is final: its CSV row may already be written, so later updates, such as the
+            # exit status of an EnergyPlus process the runner stopped, are dropped
+            if self._ranks[idf_name] == FAILED_RANK:
+                return
+            if 'status' in updates: # RESET cpu AND memory usage UPON COMPLETION
+                status = updates['status']
+                if status == 'Completed' or status.startswith(FAILED_PREFIX):
+                    updates['cpu'] = 0.0
+                    updates['memory'] = 0.0
+            info = self.simulations[idf_name]
+            info.update(updates)
+            self._changed = True
+            
+            if 'status' in updates:
+                self._status_changed(idf_name, info)
+            if 'progress' in updates:
+                info['progress_text'] = format_progress(info['progress'])
+            
+            # If start_time is being set for the first time, set it
+            if 'status' in updates and updates['status'] == 'Running' and not self.simulations[idf_name]['start_time']:
+                self.simulations[idf_name]['start_time'] = time.time()
+    
+    def update_resource_usage(self, samples):
+        """Record (idf_name, cpu, memory) samples, ignoring those that arrive after a simulation finished"""
+        with self._lock:
+            for idf_name, cpu, memory in samples:
+                info = self.simulations.get(idf_name)
+                if info and info['status'] in ('Running', 'Initializing'):
+                    info['cpu'] = cpu
+                    info['memory'] = memory
+                    self._changed = True
+
+    def get_active_pids(self):
+        """Return (idf_name, pid) pairs for simulations with a running EnergyPlus process"""
+        with self._lock:
+            # The running bucket holds exactly the Running and Initializing simulations
+            running = self._buckets[STATUS_RANK['Running']]
+            return [(name, self.simulations[name]['pid']) for name in running if self.simulations[name]['pid']]
     
     def add_log(self, idf_name, line):
         """Add a log line for a simulation"""
+        line, matches = scan_log_line(line)
         with self._lock:
-            if idf_name in self.simulations:
-                # Keep last 10 log lines
-                logs = self.simulations[idf_name]['log']
-                logs.append(line.strip())
-                if len(logs) > 10:
-                    logs.pop(0)
-                
-                # Check for warnings and errors
-                line_lower = line.lower()
-                if '* warning *' in line_lower:
-                    self.simulations[idf_name]['warnings'] += 1
-                if '* severe *' in line_lower or 'fatal' in line_lower or 'error' in line_lower:
-                    self.simulations[idf_name]['errors'] += 1
-                
-                # Try to estimate progress
-                if 'begin month=' in line_lower:
-                    try:
-                        month = int(line.split('month=')[1].split()[0])
-                        self.simulations[idf_name]['progress'] = min(100, int((month / 12) * 100))
-                    except:
-                        pass
-                elif 'percentage through simulation:' in line_lower:
-                    try:
-                        progress = float(line.split('percentage through simulation:')[1].split('%')[0].strip())
-                        self.simulations[idf_name]['progress'] = min(100, int(progress))
-                    except:
-                        pass
-                elif 'energyplus starting' in line_lower or 'starting energyplus' in line_lower:
-                    self.simulations[idf_name]['status'] = 'Running'
-                    self.simulations[idf_name]['progress'] = max(1, self.simulations[idf_name]['progress'])
-                elif 'starting simulation at' in line_lower:
-                    self.simulations[idf_name]['status'] = 'Running'
-                    self.simulations[idf_name]['progress'] = max(5, self.simulations[idf_name]['progress'])
-                elif 'warming up {' in line_lower:
-                    self.simulations[idf_name]['status'] = 'Running'
-                    # Extract the warmup number and update progress
-                    try:
-                        warmup_num = int(line_lower.split('{')[1].split('}')[0])
-                        self.simulations[idf_name]['progress'] = max(5 + warmup_num * 2, self.simulations[idf_name]['progress'])
-                    except:
-                        self.simulations[idf_name]['progress'] = max(10, self.simulations[idf_name]['progress'])
-                
-                # Check for completion or fatal errors
-                if 'energyplus completed successfully' in line_lower:
-                    self.simulations[idf_name]['status'] = 'Completed'
-                    self.simulations[idf_name]['progress'] = 100
-                    self.simulations[idf_name]['end_time'] = time.time()
-                elif 'fatal' in line_lower or '**fatal:' in line_lower or 'fatal error' in line_lower:
-                    self.simulations[idf_name]['status'] = 'Failed'
-                    self.simulations[idf_name]['progress'] = 100  # Mark as 100% to show it's done
-                    self.simulations[idf_name]['end_time'] = time.time()
-                    self.simulations[idf_name]['errors'] += 1
+            self._apply_log(idf_name, line, matches)
+    
+    def add_message(self, text):
+        """Add a runner or worker message to the messages panel"""
+        with self._lock:
+            self._apply_message(text)
+    
+    def _apply_message(self, text):
+        """Record a message; the caller must hold the lock"""
+        self.messages.append(text)
+        self._changed = True
+        self._logs_changed = True
+    
+    def apply_batch(self, messages):
+        """Apply a batch of UPDATE, LOG, LOG_BATCH and INFO messages under a single lock acquisition"""
+        # Scan log lines before taking the lock
+        prepared = []
+        for message in messages:
+            if message[0] == "UPDATE":
+                prepared.append((self._apply_update, message[1], message[2]))
+            elif message[0] == "LOG":
+                line, matches = scan_log_line(message[2])
+                prepared.append((self._apply_log, message[1], line, matches))
+            elif message[0] == "LOG_BATCH":
+                for line in message[2]:
+                    line, matches = scan_log_line(line)
+                    prepared.append((self._apply_log, message[1], line, matches))
+            elif message[0] == "INFO":
+                prepared.append((self._apply_message, message[1]))
+        
+        with self._lock:
+            for apply, *args in prepared:
+                apply(*args)
+    
+    def _apply_log(self, idf_name, line, matches):
+        """Apply a scanned log line; the caller must hold the lock"""
+        if idf_name in self.simulations:
+            info = self.simulations[idf_name]
+            
+            # Remember the highlight style with the line so rendering needs no rescan
+            if 'warning' in matches:
+                style = 'yellow'
+            elif 'error' in matches or 'fatal' in matches or 'fatal_summary' in matches:
+                style = 'red'
+            else:
+                style = None
+            info['log'].append((line, style))
+            self._changed = True
+            self._logs_changed = True
+            
+            # Lines still arriving from a failed simulation are shown but change nothing
+            if not matches or self._ranks[idf_name] == FAILED_RANK:
+                return
+            status = info['status']
+            progress = info['progress']
+            
+            # Check for warnings and errors
+            if 'warning' in matches:
+                info['warnings'] += 1
+            if 'error' in matches or 'fatal' in matches:
+                info['errors'] += 1
+            
+            # Try to estimate progress
+            if 'month' in matches:
+                month = int(matches['month'].group('month'))
+                info['progress'] = min(100, int((month / 12) * 100))
+            elif 'percent' in matches:
+                try:
+                    info['progress'] = min(100, int(float(matches['percent'].group('percent'))))
+                except ValueError:
+                    pass
+            elif 'starting' in matches:
+                info['status'] = 'Running'
+                info['progress'] = max(1, info['progress'])
+            elif 'sim_start' in matches:
+                info['status'] = 'Running'
+                info['progress'] = max(5, info['progress'])
+            elif 'warmup' in matches:
+                info['status'] = 'Running'
+                # Extract the warmup number and update progress
+                warmup = matches['warmup'].group('warmup')
+                if warmup:
+                    info['progress'] = max(5 + int(warmup) * 2, info['progress'])
+                else:
+                    info['progress'] = max(10, info['progress'])
+            
+            # Check for completion or fatal errors
+            if 'completed' in matches:
+                info['status'] = 'Completed'
+                info['progress'] = 100
+                info['end_time'] = time.time()
+            elif 'fatal' in matches or 'fatal_summary' in matches:
+                info['status'] = 'Failed'
+                info['progress'] = 100  # Mark as 100% to show it's done
+                info['end_time'] = time.time()
+            
+            if info['status'] != status:
+                self._status_changed(idf_name, info)
+            if info['progress'] != progress:
+                info['progress_text'] = format_progress(info['progress'])
+    
+    def pop_changed(self):
+        """
+        Report what changed since the last call, and reset the flags.
+        
+        Returns:
+            tuple: (anything changed, log or messages panels changed)
+        """
+        with self._lock:
+            changed = (self._changed, self._logs_changed)
+            self._changed = self._logs_changed = False
+            return changed
+    
+    def pop_failed(self):
+        """Return the simulations that turned Failed since the last call"""
+        with self._lock:
+            failed = self._failed
+            self._failed = []
+            return failed
+    
+    def _status_changed(self, idf_name, info):
+        """Re-render the status cell and move the simulation to its table position; the caller must hold the lock"""
+        # Status decides which log panels are shown and their border color
+        self._logs_changed = True
+        info['status_text'] = format_status(info['status'])
+        rank = status_rank(info['status'])
+        old_rank = self._ranks[idf_name]
+        if rank != old_rank:
+            del self._buckets[old_rank][idf_name]
+            self._buckets[rank][idf_name] = None
+            self._ranks[idf_name] = rank
+            if rank == FAILED_RANK:
+                self._failed.append(idf_name)
     
-    def get_table(self, completed_count=None, total=None):
-        """Generate a rich Table to display simulation status"""
+    def get_table(self, completed_count=None, total=None, max_rows=None):
+        """Generate a rich Table to display simulation status, listing at most max_rows simulations"""
         title = "EnergyPlus Parallel Simulations"
         if completed_count is not None and total is not None:
             progress_pct = int((completed_count / total) * 100) if total > 0 else 0
@@ -121,29 +301,18 @@ class SimulationStatus:
         table = Table(title=title, box=box.ROUNDED)
         
         # Add columns
-        table.add_column("Simulation", style="cyan")
-        table.add_column("Status", style="green")
-        table.add_column("Progress", style="magenta")
-        table.add_column("CPU %", style="yellow")
-        table.add_column("Memory", style="yellow")
-        table.add_column("Warnings", style="yellow")
-        table.add_column("Errors", style="red")
-        table.add_column("Runtime", style="blue")
+        for header, style in TABLE_COLUMNS:
+            table.add_column(header, style=style)
         
         # Add rows for each simulation sorted by status (running first, then waiting, then completed)
         with self._lock:
-            # Sort simulations by status: Running/Initializing first, then Waiting, then Completed/Failed
-            sorted_sims = sorted(
-                self.simulations.items(),
-                key=lambda x: (
-                    0 if x[1]['status'].startswith('Failed') else
-                    1 if x[1]['status'] in ['Running', 'Initializing'] else
-                    2 if x[1]['status'] == 'Waiting' else
-                    3
-                )
-            )
+            # Buckets are already in table order, so no sorting is needed
+            names = chain.from_iterable(self._buckets)
+            if max_rows is not None:
+                names = islice(names, max_rows)
             
-            for name, info in sorted_sims:
+            for name in names:
+                info = self.simulations[name]
                 # Calculate runtime
                 if info['end_time'] and info['start_time']:
                     runtime = info['end_time'] - info['start_time']
@@ -154,31 +323,21 @@ class SimulationStatus:
                 
                 runtime_str = f"{int(runtime // 60)}m {int(runtime % 60)}s"
                 
-                # Progress bar representation
-                progress = info['progress']
-                progress_bar = f"[{'#' * (progress // 5)}{' ' * (20 - progress // 5)}] {progress}%"
-                
-                # Status color
-                status = info['status']
-                if status == 'Waiting':
-                    status_color = 'yellow'
-                elif status == 'Initializing' or status == 'Running':
-                    status_color = 'green'
-                elif status == 'Completed':
-                    status_color = 'blue'
-                else:
-                    status_color = 'red'
-                
                 table.add_row(
                     name,
-                    f"[{status_color}]{status}[/{status_color}]",
-                    progress_bar,
+                    info['status_text'],
+                    info['progress_text'],
                     f"{info['cpu']:.1f}%",
                     f"{info['memory']:.1f} MB",
                     str(info['warnings']),
                     str(info['errors']),
                     runtime_str
                 )
+            
+            # Summarize the simulations that did not fit
+            hidden = len(self.simulations) - len(table.rows)
+            if hidden > 0:
+                table.add_row(f"... {hidden} more", "", "", "", "", "", "", "")
         
         return table
     
@@ -187,16 +346,15 @@ class SimulationStatus:
         
         panels = []
         with self._lock:
-            # Focus on active simulations first, then recently completed
-            active_sims = [name for name, info in self.simulations.items() 
-                          if info['status'] in ['Running', 'Initializing']]
+            # Focus on active simulations first, then completed; read from the status buckets
+            # so waiting simulations are never visited
+            active_sims = list(self._buckets[STATUS_RANK['Running']])
             
-            # Add recently completed or failed if we have space
+            # Add completed or failed if we have space
             if len(active_sims) < 8:  # Limit to reasonable number for display
-                completed_sims = [name for name, info in self.simulations.items() 
-                                 if info['status'] in ['Completed', 'Failed'] and info['log']]
-                # Take the most recent completions first (up to a reasonable limit)
-                active_sims.extend(completed_sims[:8-len(active_sims)])
+                completed_sims = (name for name in chain(self._buckets[OTHER_RANK], self._buckets[FAILED_RANK])
+                                  if self.simulations[name]['status'] in ('Completed', 'Failed') and self.simulations[name]['log'])
+                active_sims.extend(islice(completed_sims, 8 - len(active_sims)))
             
             for name in active_sims:
                 info = self.simulations[name]
@@ -204,19 +362,13 @@ class SimulationStatus:
                 if not logs:  # Skip if no logs
                     continue
                     
-                log_text = Text("\n".join(logs))
-                
-                # Apply color to warning and error messages
-                for i, line in enumerate(logs):
-                    line_lower = line.lower()
-                    if "* warning *" in line_lower:
-                        start = log_text.plain.find(line)
-                        end = start + len(line)
-                        log_text.stylize("yellow", start, end)
-                    elif "* severe *" in line_lower or "fatal" in line_lower or "error" in line_lower:
-                        start = log_text.plain.find(line)
-                        end = start + len(line)
-                        log_text.stylize("red", start, end)
+                # Color warning and error messages as the lines are appended
+                log_text = Text()
+                last = len(logs) - 1
+                for i, (line, style) in enumerate(logs):
+                    log_text.append(line, style=style)
+                    if i < last:
+                        log_text.append("\n")
                 
                 # Use different border colors based on status
                 status = info['status']
@@ -224,7 +376,7 @@ class SimulationStatus:
                     border_style = "green"
                 elif status == 'Completed':
                     border_style = "blue"
-                elif status == 'Failed' or status.startswith('Failed ('):
+                elif status.startswith(FAILED_PREFIX):
                     border_style = "red"
                 else:
                     border_style = "yellow"
@@ -238,66 +390,96 @@ class SimulationStatus:
                 
         # Return a columns layout with all panels
         return Columns(panels)
+    
+    def get_messages_panel(self):
+        """Generate a panel with the most recent runner and worker messages"""
+        with self._lock:
+            skip = max(0, len(self.messages) - MESSAGE_PANEL_LINES)
+            lines = list(islice(self.messages, skip, None))
+        # One row per message, so the newest lines are never pushed out of the fixed-height panel
+        return Panel(Text("\n".join(lines), no_wrap=True, overflow="ellipsis"), title="Messages")
 
 
-def process_monitor(pid, idf_name, update_queue):
-    """Monitor CPU and memory usage of a process and send updates to the queue"""
-    try:
-        process = psutil.Process(pid)
+def process_monitor(status_tracker, interval=MONITOR_INTERVAL):
+    """Sample CPU and memory usage of all running EnergyPlus processes from a single thread"""
+    previous = {}  # idf_name -> (psutil.Process, cpu seconds, sample time)
+    
+    while True:
+        active = status_tracker.get_active_pids()
+        samples = []
         
-        while True:
+        for idf_name, pid in active:
+            last = previous.get(idf_name)
             try:
-                # Check if process still exists
-                if not process.is_running():
-                    break
-                
-                # Get CPU and memory usage
-                cpu_percent = process.cpu_percent(interval=1)
-                memory_info = process.memory_info()
-                memory_mb = memory_info.rss / (1024 * 1024)
-                
-                # Send update to queue
-                update_queue.put(("UPDATE", idf_name, {
-                    'cpu': cpu_percent,
-                    'memory': memory_mb
-                }))
-                
-                # Short delay
-                time.sleep(1)
-            except:
+                process = last[0] if last and last[0].pid == pid else psutil.Process(pid)
+                # Read all process stats in one batch
+                with process.oneshot():
+                    cpu_times = process.cpu_times()
+                    memory_mb = process.memory_info().rss / (1024 * 1024)
+            except psutil.Error:
                 # Process likely ended
-                break
-    except:
-        # Process not found
-        pass
+                previous.pop(idf_name, None)
+                continue
+            
+            now = time.monotonic()
+            cpu_seconds = cpu_times.user + cpu_times.system
+            previous[idf_name] = (process, cpu_seconds, now)
+            
+            # CPU usage is the CPU time used since the last sample; the first sample is only a baseline
+            if last and last[0] is process and now > last[2]:
+                cpu_percent = 100 * (cpu_seconds - last[1]) / (now - last[2])
+                samples.append((idf_name, cpu_percent, memory_mb))
+        
+        if samples:
+            status_tracker.update_resource_usage(samples)
+        
+        # Forget processes that are no longer running
+        active_names = {idf_name for idf_name, _ in active}
+        for idf_name in list(previous):
+            if idf_name not in active_names:
+                del previous[idf_name]
+        
+        time.sleep(interval)
 
 
-def update_process(update_queue, status_tracker):
-    """Process updates from the queue and update the status tracker"""
+def update_process(update_queue, status_tracker, completed_conn=None, stop_event=None):
+    """
+    Process updates from the queue and update the status tracker.
+    
+    Args:
+        update_queue (Queue): Queue the workers send status messages on
+        status_tracker (SimulationStatus): Tracker the messages are applied to
+        completed_conn (Connection, optional): Receives the names of the simulations finished in
+            each batch, after their final status has been applied
+        stop_event (Event, optional): Once set, the thread exits as soon as the queue is empty
+    """
     while True:
+        # Wait briefly for the next message, then drain whatever else is already queued
         try:
-            message = update_queue.get(timeout=0.5)
-            if message == "DONE":
+            batch = drain_queue(update_queue, timeout=STOP_CHECK_INTERVAL)
+        except (EOFError, OSError):
+            # The queue was closed
+            break
+        
+        if not batch:
+            # Stop only once nothing is left to apply
+            if stop_event is not None and stop_event.is_set():
                 break
-            
-            # Process different message types
-            message_type = message[0]
-            
-            if message_type == "INFO":
-                print(message[1])
-            
-            elif message_type == "UPDATE":
-                # Update the status tracker
-                idf_name = message[1]
-                updates = message[2]
-                status_tracker.update_simulation(idf_name, **updates)
-            
-            elif message_type == "LOG":
-                idf_name = message[1]
-                log_message = message[2]
-                status_tracker.add_log(idf_name, log_message)
-            
-        except queue.Empty:
             continue
+        
+        updates = []  # Messages for the status tracker
+        completed = []  # Names of the simulations finished in this batch
+        try:
+            # Dispatch known message types in a single pass; anything else is dropped
+            for message in batch:
+                message_type = message[0]
+                if message_type in TRACKER_MESSAGES:
+                    updates.append(message)
+                elif message_type == "COMPLETED":
+                    completed.append(message[1])
+            
+            status_tracker.apply_batch(updates)
+            if completed and completed_conn is not None:
+                completed_conn.send(completed)
         except Exception as e:
-            print(f"Error in update process: {str(e)}")
\ No newline at end of file
+            print(f"Error in update process: {str(e)}")
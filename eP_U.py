@@ -5,13 +5,27 @@
 
 import os
 import re
-import csv
 import json
 import tempfile
 import ctypes
 import sys
+import locale
+import mmap
+import queue
 import multiprocessing
-from eP_C import OUTPUT_FILE_MAP, CSV_HEADERS
+from eP_C import OUTPUT_FILE_MAP, OUTPUT_PARAM_NAMES
+
+# Optional faster JSON encoder for the GUI -> simulation config handoff
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# OutputControl:Files object in an IDF, matched on raw bytes so the file is never decoded
+OUTPUT_CONTROL_PATTERN = re.compile(rb'OutputControl:Files,\s*([^;]*);', re.IGNORECASE | re.DOTALL)
+
+# Encoding of the matched object, the same one a text mode open() of the IDF would use
+IDF_ENCODING = locale.getpreferredencoding(False)
 
 
 def parse_output_controls(idf_file):
@@ -25,26 +39,23 @@ def parse_output_controls(idf_file):
         tuple: (output_controls dict, output_file_map dict)
     """
     try:
-        with open(idf_file, 'r') as f:
-            content = f.read()
+        # Find the OutputControl:Files object by scanning the memory-mapped file
+        with open(idf_file, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return None, OUTPUT_FILE_MAP
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                match = OUTPUT_CONTROL_PATTERN.search(mm)
+                params_text = match.group(1).decode(IDF_ENCODING, errors='replace') if match else None
         
-        # Find the OutputControl:Files object
-        pattern = r'OutputControl:Files,\s*([^;]*);'
-        match = re.search(pattern, content, re.IGNORECASE | re.DOTALL)
-        
-        if not match:
+        if params_text is None:
             return None, OUTPUT_FILE_MAP
         
         # Extract parameters
-        params_text = match.group(1).strip()
-        params = [p.strip() for p in params_text.split(',')]
-        
-        # Define the parameter names in order
-        param_names = list(OUTPUT_FILE_MAP.keys())
+        params = [p.strip() for p in params_text.strip().split(',')]
         
         # Create dictionary of parameters
         output_controls = {}
-        for i, name in enumerate(param_names):
+        for i, name in enumerate(OUTPUT_PARAM_NAMES):
             if i < len(params):
                 # Clean up comments from values
                 value = params[i].split('!')[0].strip()
@@ -59,6 +70,54 @@ def parse_output_controls(idf_file):
         return None, OUTPUT_FILE_MAP
 
 
+def scan_simulation_folder(folder):
+    """
+    Find IDF and EPW files in a folder with a single directory pass
+    
+    Args:
+        folder (str): Folder to scan
+    
+    Returns:
+        tuple: (list of IDF file paths, list of EPW file paths)
+    """
+    idf_files = []
+    epw_files = []
+    files_by_suffix = {'.idf': idf_files, '.epw': epw_files}
+    suffixes = tuple(files_by_suffix)
+    with os.scandir(folder) as entries:
+        for entry in entries:
+            # normcase keeps matching case-insensitive on Windows, like glob
+            name = os.path.normcase(entry.name)
+            # is_file() uses the type cached by scandir, so it costs no extra stat on most systems
+            if name.endswith(suffixes) and entry.is_file():
+                files_by_suffix[name[name.rfind('.'):]].append(entry.path)
+    return idf_files, epw_files
+
+
+def drain_queue(source, timeout=None):
+    """
+    Wait for the next item on a queue, then take every item already queued behind it.
+    
+    Args:
+        source (Queue): Queue to read
+        timeout (float, optional): Seconds to wait for the first item; None waits indefinitely
+    
+    Returns:
+        list: Items in queue order, empty if nothing arrived within the timeout
+    """
+    try:
+        items = [source.get(timeout=timeout)]
+    except queue.Empty:
+        return []
+    
+    try:
+        while True:
+            items.append(source.get_nowait())
+    except queue.Empty:
+        pass
+    return items
+
+
 def resolve_csv_path(csv_output, idf_files):
     """
     Resolve the CSV output path based on whether it's a filename or full path.
@@ -94,15 +153,19 @@ def resolve_csv_path(csv_output, idf_files):
 def save_config_to_temp(config):
     """Save configuration to a temporary file"""
     temp_file = tempfile.mktemp(suffix='.json', prefix='epp_config_')
-    with open(temp_file, 'w') as f:
-        json.dump(config, f)
+    if orjson:
+        with open(temp_file, 'wb') as f:
+            f.write(orjson.dumps(config))
+    else:
+        with open(temp_file, 'w') as f:
+            json.dump(config, f)
     return temp_file
 
 
 def load_config_from_temp(config_file):
     """Load configuration from temporary file"""
     try:
-        with open(config_file, 'r') as f:
+        with open(config_file, 'r', encoding='utf-8') as f:
             config = json.load(f)
         os.unlink(config_file)  # Delete temp file
         return config
@@ -111,25 +174,20 @@ def load_config_from_temp(config_file):
         return None
 
 
-def add_simulation_to_csv(idf_file, weather_file, info, row_number, csv_file):
+def build_csv_row(idf_name, idf_basename, weather_base, info, row_number):
     """
-    Add a single simulation result to the CSV file.
+    Format a single simulation result as a CSV results row.
     
     Args:
-        idf_file (str): Path to the IDF file
-        weather_file (str): Path to the weather file
+        idf_name (str): Simulation name (IDF file name without extension)
+        idf_basename (str): IDF file name
+        weather_base (str): Weather file name
         info (dict): Simulation status information
         row_number (int): Row number for this simulation
-        csv_file (str): Path to the CSV file
-    """
-    # Check if CSV file exists, create with header if not
-    file_exists = os.path.isfile(csv_file)
-    
-    # Get the base names
-    idf_basename = os.path.basename(idf_file)
-    idf_name = os.path.splitext(idf_basename)[0]
-    weather_base = os.path.basename(weather_file)
     
+    Returns:
+        list: Row values in CSV_HEADERS order
+    """
     # Determine completion status - any non-completed status is considered failed (0)
     progress = 1 if info['status'] == 'Completed' else 0
     
@@ -145,8 +203,7 @@ def add_simulation_to_csv(idf_file, weather_file, info, row_number, csv_file):
     minutes = int((runtime % 3600) // 60)
     seconds = int(runtime % 60)
     
-    # Format data for CSV
-    row = [
+    return [
         row_number,              # Row number / sequential ID
         idf_name,                # Job_ID
         weather_base,            # WeatherFile
@@ -159,17 +216,21 @@ def add_simulation_to_csv(idf_file, weather_file, info, row_number, csv_file):
         f"{minutes:02d}",        # Minutes
         f"{seconds:02d}"         # Seconds
     ]
-    
-    with open(csv_file, 'a', newline='') as f:
-        writer = csv.writer(f)
-        
-        # Write header if file doesn't exist
-        if not file_exists:
-            writer.writerow(CSV_HEADERS)
 
-        writer.writerow(row)
-        
-    print(f"Added to CSV: {idf_name} - Status: {info['status']} - Progress: {progress}")
+
+def add_simulation_to_csv(writer, idf_name, idf_basename, weather_base, info, row_number):
+    """
+    Add a single simulation result to the open CSV results file.
+    
+    Args:
+        writer (csv.writer): Writer for the results file; the header is already written
+        idf_name (str): Simulation name (IDF file name without extension)
+        idf_basename (str): IDF file name
+        weather_base (str): Weather file name
+        info (dict): Simulation status information
+        row_number (int): Row number for this simulation
+    """
+    writer.writerow(build_csv_row(idf_name, idf_basename, weather_base, info, row_number))
 
 
 def allocate_console():
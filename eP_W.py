@@ -0,0 +1,395 @@
+"""
+ worker
+ runs EnergyPlus simulations inside the worker processes
+"""
+
+import os
+import re
+import time
+import locale
+import shutil
+import tempfile
+import subprocess
+
+# Only the standard library and the constants module are imported here: spawned workers
+# import this module, and keeping Rich and psutil out of it keeps worker startup cheap
+from eP_C import LOG_LINES, EPLUS_EXECUTABLE
+
+
+# Maximum number of bytes read from EnergyPlus output at a time
+READ_CHUNK_SIZE = 65536
+
+# Encoding used to decode EnergyPlus output, same as a text mode pipe
+OUTPUT_ENCODING = locale.getpreferredencoding(False)
+
+# EnergyPlus files placed next to the IDF in each run directory, when present
+AUX_FILE_NAMES = ('Energy+.idd', 'DElight2.dll', 'libexpat.dll', 'bcvtb.dll')
+
+# Progress lines make up most of the EnergyPlus output and start with their keyword,
+# so they are recognized with one anchored match. The name of the matching group
+# identifies the kind of line; "continuing" lines carry no information the table uses.
+PROGRESS_PATTERN = re.compile(
+    r'(?P<continuing>continuing simulation at)'
+    r'|begin month=\s*(?P<month>\d+)'
+    r'|percentage through simulation:\s*(?P<percent>[\d.]+)'
+    r'|(?P<starting>energyplus starting|starting energyplus)'
+    r'|(?P<sim_start>starting simulation at)'
+    r'|warming up \{(?P<warmup>\d*)'
+    r'|(?P<completed>energyplus completed successfully)',
+    re.IGNORECASE
+)
+
+# Warnings and errors, scanned for anywhere in the lines that are not progress lines.
+# Errors only match EnergyPlus message markers ("** Severe  **", "** Error"), not summaries
+# like "0 Severe Errors"; a fatal summary ("Terminated--Fatal Error Detected") fails the run
+# without counting another error.
+DIAGNOSTIC_PATTERN = re.compile(
+    r'(?P<warning>\*\s*warning\s*\*)'
+    r'|(?P<fatal>\*\s*fatal\s*\*)'
+    r'|(?P<fatal_summary>\bfatal\b)'
+    r'|(?P<error>\*\s*severe\s*\*|\*\*\s*error)',
+    re.IGNORECASE
+)
+
+# Lines that end a run early ("**fatal", "fatal error", "fatal:"), and the line of a successful run.
+# Both are searched once over all the lines of a read, instead of per line
+FATAL_PATTERN = re.compile(r'\*\*fatal|fatal error|fatal:', re.IGNORECASE)
+COMPLETED_PATTERN = re.compile(r'energyplus completed successfully', re.IGNORECASE)
+
+
+def find_auxiliary_files(eplus_dir):
+    """Return the paths of the auxiliary EnergyPlus files that exist in eplus_dir"""
+    eplus_dir = os.path.abspath(eplus_dir)
+    paths = [os.path.join(eplus_dir, name) for name in AUX_FILE_NAMES]
+    return [path for path in paths if os.path.exists(path)]
+
+
+def stage_file(src, dst):
+    """Hard link src to dst, copying it when a link is not possible (e.g. another volume)"""
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
+def prepare_run_directory(run_dir, files):
+    """
+    Stage the files every simulation needs into a run directory.
+    
+    Args:
+        run_dir (str): Directory EnergyPlus runs in
+        files (list): Auxiliary EnergyPlus files and the weather file to stage
+    
+    Returns:
+        set: Names of the staged files, kept when the directory is cleared between simulations
+    """
+    for src_path in files:
+        stage_file(src_path, os.path.join(run_dir, os.path.basename(src_path)))
+    
+    # Create empty Energy+.ini file
+    open(os.path.join(run_dir, 'Energy+.ini'), 'w').close()
+    
+    return {os.path.basename(path) for path in files} | {'Energy+.ini'}
+
+
+def clear_run_directory(run_dir, keep):
+    """Remove everything a simulation left in a run directory except the staged files in keep"""
+    with os.scandir(run_dir) as entries:
+        for entry in entries:
+            if entry.name in keep:
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                shutil.rmtree(entry.path, ignore_errors=True)
+            else:
+                try:
+                    os.remove(entry.path)
+                except OSError:
+                    pass
+
+
+def read_output_lines(stream, chunk_size=READ_CHUNK_SIZE):
+    """
+    Read process output in chunks as it becomes available.
+    
+    Args:
+        stream (BufferedReader): Binary stdout of the process
+        chunk_size (int): Maximum number of bytes per read
+    
+    Yields:
+        list: Non-empty, stripped lines completed by each read
+    """
+    pending = b''
+    while True:
+        # read1() returns whatever is available instead of waiting for a full chunk
+        chunk = stream.read1(chunk_size)
+        if not chunk:
+            break
+        
+        lines = (pending + chunk).split(b'\n')
+        pending = lines.pop()
+        lines = [line.decode(OUTPUT_ENCODING, errors='replace').strip() for line in lines]
+        lines = [line for line in lines if line]
+        if lines:
+            yield lines
+    
+    # Output that did not end with a newline
+    line = pending.decode(OUTPUT_ENCODING, errors='replace').strip()
+    if line:
+        yield [line]
+
+
+def scan_log_line(line):
+    """Strip a log line and scan it once, keeping the first match of each kind"""
+    line = line.strip()
+    
+    # Progress lines never carry warnings or errors, so they skip the diagnostic scan
+    match = PROGRESS_PATTERN.match(line)
+    if match:
+        return line, {match.lastgroup: match}
+    
+    matches = {}
+    for match in DIAGNOSTIC_PATTERN.finditer(line):
+        matches.setdefault(match.lastgroup, match)
+    return line, matches
+
+
+def select_log_lines(lines, keep_last=LOG_LINES):
+    """
+    Pick the output lines the status tracker needs from one read.
+    
+    Every line reporting progress, a warning or an error is kept for the counts and
+    the progress bar; of the rest only the last keep_last lines can still be shown
+    in the log panel, so the others are not sent to the runner.
+    
+    Args:
+        lines (list): Stripped output lines
+        keep_last (int): Number of trailing lines always kept
+    
+    Returns:
+        list: Selected lines in output order
+    """
+    first_tail = len(lines) - keep_last
+    selected = []
+    for i, line in enumerate(lines):
+        if i >= first_tail:
+            selected.append(line)
+        else:
+            matches = scan_log_line(line)[1]
+            if matches and 'continuing' not in matches:
+                selected.append(line)
+    return selected
+
+
+def run_energyplus_simulation(idf_file, weather_file, eplus_dir, update_queue, aux_files=None, run_dir=None, keep=None):
+    """
+    Run a single EnergyPlus simulation.
+    
+    Args:
+        idf_file (str): Path to the IDF file
+        weather_file (str): Path to the EPW weather file
+        eplus_dir (str): Path to the EnergyPlus installation directory
+        update_queue (Queue): Queue for status updates
+        aux_files (list, optional): Auxiliary EnergyPlus files, resolved from eplus_dir if omitted
+        run_dir (str, optional): Prepared run directory to reuse; a temporary one is created if omitted.
+            It must already hold the auxiliary files and the weather file (see prepare_run_directory),
+            and is emptied except for keep afterwards rather than removed
+        keep (set, optional): Names of the files staged in run_dir to keep; nothing is kept if omitted
+    
+    Returns:
+        None
+    """
+    # Make sure we have absolute paths; the runner resolves them once for a worker's simulations
+    if run_dir is None:
+        idf_file = os.path.abspath(idf_file)
+        weather_file = os.path.abspath(weather_file)
+        eplus_dir = os.path.abspath(eplus_dir)
+    
+    # Get the output directory (current working directory)
+    # (same as IDF file directory)
+    try: 
+        output_dir = os.path.dirname(idf_file)
+    except: 
+        output_dir = os.getcwd()
+    
+    # Get file names
+    idf_basename = os.path.basename(idf_file)
+    idf_name = os.path.splitext(idf_basename)[0]
+    weather_basename = os.path.basename(weather_file)
+    
+    # Signal that we're starting
+    update_queue.put(("INFO", f"Starting simulation for {idf_basename}"))
+    update_queue.put(("UPDATE", idf_name, {'status': 'Initializing'}))
+    
+    if aux_files is None:
+        aux_files = find_auxiliary_files(eplus_dir)
+    
+    energyplus_exe = os.path.join(eplus_dir, EPLUS_EXECUTABLE)
+    
+    # A worker's run directory already holds the auxiliary and weather files, and the runner has
+    # checked the executable once for the batch; otherwise check it and make a temporary directory
+    temp_dir = run_dir
+    try:
+        if temp_dir is None:
+            if not os.path.exists(energyplus_exe):
+                update_queue.put(("INFO", f"Error: EnergyPlus executable not found at {energyplus_exe}"))
+                update_queue.put(("UPDATE", idf_name, {
+                    'status': 'Failed (Missing EnergyPlus)',
+                    'progress': 100,
+                    'end_time': time.time()
+                }))
+                return
+            
+            temp_dir = tempfile.mkdtemp(prefix=f"EP_{idf_name}_")
+            update_queue.put(("INFO", f"Created temporary directory: {temp_dir}"))
+            prepare_run_directory(temp_dir, [*aux_files, weather_file])
+        
+        # Copy the IDF file to the temp directory
+        temp_idf = os.path.join(temp_dir, idf_basename)
+        shutil.copy2(idf_file, temp_idf)
+        
+        # Run EnergyPlus with the correct command line
+        cmd = [
+            energyplus_exe,
+            '-w', weather_basename, # Weather file
+            '-p', idf_name,         # Prefix for output files
+            '-d', output_dir,       # Output directory
+            '-a',                   # -a flag disables the annual simulation summary (.end file)
+            idf_basename
+        ]
+        
+        cmd_str = ' '.join(cmd)
+        update_queue.put(("INFO", f"Running command: {cmd_str}"))
+        update_queue.put(("UPDATE", idf_name, {'status': 'Running'}))
+        
+        # Start the EnergyPlus process in the run directory (binary pipe with default block buffering)
+        process = subprocess.Popen(
+            cmd,
+            cwd=temp_dir,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT
+        )
+        
+        # Report the EnergyPlus process id so the parent can monitor CPU and memory
+        update_queue.put(("UPDATE", idf_name, {'pid': process.pid}))
+        
+        # Variables to track fatal errors
+        fatal_error_detected = False
+        
+        # Read output as it arrives and send it to the queue, one message per read
+        for lines in read_output_lines(process.stdout):
+            try:
+                # Check for fatal error indicators in the output, keeping the lines up to the first one
+                text = '\n'.join(lines)
+                fatal = FATAL_PATTERN.search(text)
+                if fatal:
+                    fatal_error_detected = True
+                    lines = lines[:text.count('\n', 0, fatal.start()) + 1]
+                
+                update_queue.put(("LOG_BATCH", idf_name, select_log_lines(lines)))
+                
+                if fatal_error_detected:
+                    # Immediately mark as failed
+                    update_queue.put(("UPDATE", idf_name, {
+                        'status': 'Failed (Fatal Error)',
+                        'progress': 100,  # Mark as 100% to show it's done
+                        'end_time': time.time()
+                    }))
+                    
+                    # Terminate the process since we detected a fatal error, and let it exit
+                    # before its run directory is cleared
+                    try:
+                        process.terminate()
+                        process.wait(timeout=5)
+                    except:
+                        pass
+                    break
+                
+                # Also check for successful completion
+                if COMPLETED_PATTERN.search(text):
+                    update_queue.put(("UPDATE", idf_name, {
+                        'status': 'Completed',
+                        'progress': 100,
+                        'end_time': time.time()
+                    }))
+            except:
+                # If the queue is closed, stop sending updates
+                break
+        
+        # If no fatal error was detected in the logs, wait for the process to complete
+        if not fatal_error_detected:
+            try:
+                process.wait(timeout=10)  # Wait up to 10 seconds for normal termination
+            except subprocess.TimeoutExpired:
+                # If it times out, force terminate
+                process.terminate()
+                try:
+                    process.wait(timeout=5)
+                except:
+                    # If it still doesn't terminate, force kill
+                    process.kill()
+            
+            # Update final status based on the return code (only if not already signaled as completed)
+            if process.returncode == 0:
+                update_queue.put(("UPDATE", idf_name, {
+                    'status': 'Completed',
+                    'progress': 100,
+                    'end_time': time.time()
+                }))
+            else:
+                update_queue.put(("UPDATE", idf_name, {
+                    'status': 'Failed (Exit code: {})'.format(process.returncode),
+                    'progress': 100,  # Mark as 100% to show it's done
+                    'end_time': time.time()
+                }))
+        
+    except Exception as e:
+        try:
+            update_queue.put(("INFO", f"Error running simulation for {idf_basename}: {str(e)}"))
+            update_queue.put(("UPDATE", idf_name, {
+                'status': f'Failed: {str(e)}',
+                'progress': 100,  # Mark as 100% to show it's done
+                'end_time': time.time()
+            }))
+        except:
+            # If the queue is closed, we can't send updates
+            pass
+    
+    finally:
+        # Clean up the temporary directory, or empty the worker's run directory for the next simulation
+        if run_dir is not None:
+            clear_run_directory(run_dir, keep or set())
+        elif temp_dir is not None:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+        
+        # Signal completion exactly once, whatever the outcome, after the final status update
+        try:
+            update_queue.put(("COMPLETED", idf_name))
+        except:
+            pass
+
+
+def simulation_worker(conn, update_queue, aux_files, weather_file, eplus_dir, run_dir):
+    """
+    Run simulations received from the runner until it sends None.
+    
+    Args:
+        conn (Connection): Worker end of the pipe jobs (absolute IDF file paths) arrive on
+        update_queue (Queue): Queue for status updates
+        aux_files (list): Auxiliary EnergyPlus files to stage for every simulation
+        weather_file (str): Absolute path to the EPW weather file shared by the batch
+        eplus_dir (str): Absolute path to the checked EnergyPlus installation directory
+        run_dir (str): Empty directory reused for all of the worker's simulations, removed on exit
+    """
+    # The weather file is the same for the whole batch, so it is staged once with the auxiliary files
+    try:
+        keep = prepare_run_directory(run_dir, [*aux_files, weather_file])
+        while True:
+            idf_file = conn.recv()
+            if idf_file is None:
+                break
+            run_energyplus_simulation(idf_file, weather_file, eplus_dir, update_queue, aux_files, run_dir, keep)
+    except (EOFError, KeyboardInterrupt):
+        # The runner went away or the user interrupted the batch
+        pass
+    finally:
+        shutil.rmtree(run_dir, ignore_errors=True)